@@ -1,12 +1,20 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
+import json
+import threading
+import time
 from contextlib import contextmanager
-from typing import Generator, Tuple
+from typing import Any, Callable, Dict, Generator, List, Tuple, Union
+from unittest.mock import patch
+from urllib.parse import urlsplit
 
 import pytest
+from requests import PreparedRequest, Response, Session
 
 from zammadoo.tickets import Ticket
 
+RouteType = Union[Any, Callable[[PreparedRequest], Tuple[int, Any, Dict[str, str]]]]
+
 
 @pytest.fixture(scope="function")
 def single_ticket(rclient, temporary_resources) -> Generator[Ticket, None, None]:
@@ -71,3 +79,71 @@ def assert_existing_tags(zammad_api):
         _cleanup(temporary_tags)
 
     return _create_temporary
+
+
+class FakeServer:
+    """answers the requests of a patched :class:`requests.Session` offline"""
+
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], Tuple[RouteType, int, float]] = {}
+        self.requests: List[PreparedRequest] = []
+        self.lock = threading.Lock()
+
+    def add(
+        self, method: str, url: str, body: RouteType, status=200, delay_s=0.0
+    ) -> None:
+        self.routes[(method, url)] = body, status, delay_s
+
+    def count(self, method: str, url: str) -> int:
+        with self.lock:
+            return sum(
+                1
+                for request in self.requests
+                if request.method == method
+                and urlsplit(request.url)._replace(query="").geturl() == url
+            )
+
+    def __call__(self, method: str, url: str, **kwargs) -> Response:
+        request = PreparedRequest()
+        request.prepare(
+            method=method,
+            url=url,
+            headers=kwargs.get("headers"),
+            data=kwargs.get("data"),
+            params=kwargs.get("params"),
+            json=kwargs.get("json"),
+            files=kwargs.get("files"),
+        )
+        with self.lock:
+            self.requests.append(request)
+
+        assert request.url
+        key = (method, urlsplit(request.url)._replace(query="").geturl())
+        try:
+            body, status, delay_s = self.routes[key]
+        except KeyError:
+            body, status, delay_s = {"error": "No route matches"}, 404, 0.0
+
+        headers: Dict[str, str] = {}
+        if callable(body):
+            status, body, headers = body(request)
+        if delay_s:
+            time.sleep(delay_s)
+
+        response = Response()
+        response.status_code = status
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+        response.headers.update({"Content-Type": "application/json", **headers})
+        # pylint: disable=protected-access
+        response._content = b"" if body is None else json.dumps(body).encode("utf-8")
+        response._content_consumed = True
+        return response
+
+
+@pytest.fixture(scope="function")
+def fake_server() -> Generator[FakeServer, None, None]:
+    server = FakeServer()
+    with patch.object(Session, "request", new=server):
+        yield server
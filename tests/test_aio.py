@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import asyncio
+
+import pytest
+
+from zammadoo.aio import AsyncClient
+
+from . import fake_server
+
+URL = "https://localhost/api/v1"
+
+
+@pytest.fixture(scope="function")
+def aclient():
+    return AsyncClient(URL, http_token="myfaketoken", max_concurrency=5)
+
+
+def test_async_client_shares_cache_with_client(aclient):
+    assert repr(aclient) == f"<AsyncClient {URL!r}>"
+    assert aclient.tickets.cache is aclient.client.tickets.cache
+    assert aclient.tickets(123) == aclient.client.tickets(123)
+
+
+def test_async_get_requests_concurrently(aclient, fake_server):
+    for uid in range(1, 11):
+        fake_server.add("GET", f"{URL}/users/{uid}", {"id": uid}, delay_s=0.05)
+
+    async def main():
+        async with aclient:
+            return await asyncio.gather(
+                *(aclient.users.get(uid) for uid in range(1, 11))
+            )
+
+    users = asyncio.run(main())
+    assert [user.id for user in users] == list(range(1, 11))
+    assert len(aclient.client.users.cache) == 10
+
+
+def test_async_iteration_and_search(aclient, fake_server):
+    fake_server.add("GET", f"{URL}/groups", [{"id": 1}, {"id": 2}])
+    fake_server.add("GET", f"{URL}/users/search", [{"id": 3}])
+
+    async def main():
+        async with aclient:
+            groups = [group.id async for group in aclient.groups.iter(per_page=5)]
+            users = [user.id async for user in aclient.users.search("foo")]
+            return groups, users
+
+    assert asyncio.run(main()) == ([1, 2], [3])
+
+
+def test_async_proxy_methods_are_awaitable(aclient, fake_server):
+    fake_server.add("GET", f"{URL}/users/me", {"id": 7, "login": "me"})
+    fake_server.add("GET", f"{URL}/tags", {"tags": ["foo"]})
+
+    async def main():
+        async with aclient:
+            return await aclient.users.me(), await aclient.tags.by_ticket(1)
+
+    user, tags = asyncio.run(main())
+    assert user.login == "me"
+    assert tags == ["foo"]
+
+
+def test_async_impersonation_is_task_local(aclient, fake_server):
+    def _route(request):
+        login = request.headers.get("X-On-Behalf-Of")
+        return 200, {"id": 2 if login else 1, "login": login}, {}
+
+    fake_server.add("GET", f"{URL}/users/me", _route, delay_s=0.02)
+
+    async def whoami(user):
+        if user is None:
+            return (await aclient.users.me()).login
+        with aclient.impersonation_of(user):
+            return (await aclient.users.me()).login
+
+    async def main():
+        async with aclient:
+            return await asyncio.gather(whoami("agent"), whoami(None))
+
+    assert asyncio.run(main()) == ["agent", None]
+    assert aclient.client.on_behalf_of is None
+
+
+def test_async_iteration_closes_the_iterator(aclient):
+    import threading
+
+    closed = []
+
+    def numbers():
+        try:
+            yield from range(10)
+        finally:
+            closed.append(threading.current_thread().name)
+
+    async def main():
+        async with aclient:
+            items = aclient.iterate(numbers)
+            async for item in items:
+                if item == 2:
+                    break
+            await items.aclose()
+
+    asyncio.run(main())
+    # closed by the executor, not by the garbage collector
+    assert len(closed) == 1
+    assert closed[0].startswith("zammadoo")
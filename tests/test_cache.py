@@ -1,13 +1,21 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 
+import random
+import threading
 import time
 from itertools import zip_longest
 from operator import eq
 
 import pytest
 
-from zammadoo.cache import LruCache
+from zammadoo.cache import (
+    CacheStats,
+    LruCache,
+    SqliteStore,
+    TwoQueuePolicy,
+    estimate_size,
+)
 
 
 def fill_by_setitem(cache: LruCache, rng: range):
@@ -183,3 +191,321 @@ def test_evict_by_age():
 
     cache.evict(max_age_s=0.0145)
     assert cache.keys() == {"second"}
+
+
+def test_concurrent_access_loses_no_updates():
+    cache = LruCache()
+    bounded = LruCache(max_size=50)
+    errors = []
+
+    def worker(offset: int):
+        try:
+            for item in range(offset, offset + 2000):
+                cache[item] = item
+                bounded[item % 100] = item
+                assert bounded.get(item % 100, item) is not None
+                if item % 3 == 0:
+                    bounded.pop((item + 1) % 100)
+                    cache.setdefault(("copy", item), item)
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n * 2000,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(bounded) <= 50
+    assert all(key == value for key, value in cache.items() if isinstance(key, int))
+    assert len(cache) == 16000 + len([i for i in range(16000) if i % 3 == 0])
+
+
+def test_get():
+    cache = LruCache(max_size=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    assert cache.get("c") is None
+    assert cache.get("c", 3) == 3
+
+    cache["c"] = 3
+    assert list(cache.keys()) == ["a", "c"]
+
+
+def test_evict_by_age_uses_write_order():
+    cache = LruCache()
+    backend = cache.backend
+    for item, timestamp in (("a", 1.0), ("b", 2.0), ("c", 3.0), ("d", 4.0)):
+        backend.set(item, (timestamp, item, None))
+    _ = cache["a"]
+    cache["b"] = "B"  # rewritten with the current time
+
+    backend.pop_older(3.5)
+    assert list(cache.keys()) == ["d", "b"]
+
+    backend.set("e", (0.5, "e", None))  # out of write order
+    backend.pop_older(3.5)
+    assert list(cache.keys()) == ["d", "b"]
+
+
+def test_max_age_s_expires_items_on_read():
+    cache = LruCache(max_age_s=0.01)
+    cache["plain"] = 1
+    cache.set("validated", 2, {"If-None-Match": '"2"'})
+    assert "plain" in cache and cache["validated"] == 2
+
+    time.sleep(0.015)
+    assert "plain" not in cache
+    assert cache.get("validated") is None
+    with pytest.raises(KeyError):
+        _ = cache["validated"]
+    assert cache.get("validated", stale=True) == 2
+    assert list(cache.keys()) == ["validated"]
+
+    assert cache.setdefault("plain", 3) == 3
+    cache.max_age_s = None
+    assert cache["validated"] == 2
+
+
+def test_max_bytes_evicts_least_recently_used():
+    cache = LruCache(max_bytes=100, size_estimator=len)
+    cache["a"] = "x" * 40
+    cache["b"] = "x" * 40
+    _ = cache["a"]
+    assert cache.nbytes == 80
+
+    cache["c"] = "x" * 30
+    assert list(cache.keys()) == ["a", "c"]
+    assert cache.nbytes == 70
+
+    cache["a"] = "x" * 10
+    cache["huge"] = "x" * 101
+    assert "huge" not in cache
+    assert cache.nbytes == 40
+
+    cache.max_bytes = 35
+    assert list(cache.keys()) == ["a"]
+    del cache["a"]
+    assert cache.nbytes == 0
+
+    cache.max_bytes = None
+    cache["d"] = "x" * 1000
+    assert cache.nbytes == 1000
+
+
+@pytest.mark.parametrize("getsizeof", [True, False])
+def test_estimate_size(getsizeof, monkeypatch):
+    import sys
+
+    if not getsizeof:
+        # like PyPy, where only the default is returned
+        def _getsizeof(_obj, *default):
+            if not default:
+                raise TypeError("not supported")
+            return default[0]
+
+        monkeypatch.setattr(sys, "getsizeof", _getsizeof)
+
+    small = {"id": 1, "name": "low"}
+    large = {"id": 2, "name": "high", "body": "<p>" + "text " * 1000 + "</p>"}
+    assert 0 < estimate_size(small) < estimate_size(large)
+    assert estimate_size([small, small]) > 2 * estimate_size(small)
+
+
+@pytest.mark.parametrize("persistent", [False, True])
+def test_written_at(persistent, tmp_path):
+    backend = SqliteStore(tmp_path / "cache.db")("users") if persistent else None
+    cache = LruCache(max_age_s=60, backend=backend)
+    assert cache.written_at("a") is None
+
+    now = [100.0]
+    cache.backend.clock = lambda: now[0]
+    cache["a"] = {"id": 1}
+    now[0] += 10
+    assert cache.written_at("a") == 100.0
+    assert cache.stats.hits + cache.stats.misses == 0
+
+    now[0] += 60
+    assert cache.written_at("a") is None
+
+
+def test_sqlite_backend_keeps_lru_order_and_persists(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = LruCache(max_size=3, backend=SqliteStore(path, touch_interval_s=0)("users"))
+    for item in range(4):
+        cache[f"url/{item}"] = {"id": item}
+    assert cache["url/1"] == {"id": 1}
+    cache.set("url/4", {"id": 4}, {"If-None-Match": '"abc"'})
+    assert list(cache.keys()) == ["url/3", "url/1", "url/4"]
+
+    other = LruCache(max_size=3, backend=SqliteStore(path)("users"))
+    assert other.items() == [
+        ("url/3", {"id": 3}),
+        ("url/1", {"id": 1}),
+        ("url/4", {"id": 4}),
+    ]
+    assert other.validators("url/4") == {"If-None-Match": '"abc"'}
+    assert 0.0 <= other.age_s("url/4") < 5.0
+    assert len(LruCache(backend=SqliteStore(path)("groups"))) == 0
+
+    del other["url/3"]
+    assert "url/3" not in cache
+    assert cache.pop("url/1") == {"id": 1}
+    cache.evict(max_age_s=-1)
+    assert len(cache) == 0
+
+
+def test_sqlite_backend_throttles_lru_updates(tmp_path):
+    store = SqliteStore(tmp_path / "cache.db")
+    cache = LruCache(backend=store("users"))
+    cache["a"] = 1
+    statements = []
+    store.connection().set_trace_callback(statements.append)
+
+    for _ in range(5):
+        assert cache["a"] == 1
+    assert not [sql for sql in statements if sql.startswith("UPDATE")]
+
+    store.touch_interval_s = 0
+    assert cache["a"] == 1
+    assert len([sql for sql in statements if sql.startswith("UPDATE")]) == 1
+
+
+def _fill_shared_cache(path, offset: int) -> None:
+    cache = LruCache(backend=SqliteStore(path)("shared"))
+    for item in range(offset, offset + 50):
+        cache[item] = item
+        assert cache.get(item - 1, item - 1) == item - 1
+
+
+def test_sqlite_backend_is_shared_by_processes(tmp_path):
+    from concurrent.futures import ProcessPoolExecutor
+
+    path = tmp_path / "cache.db"
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_fill_shared_cache, [path] * 4, range(0, 200, 50)))
+
+    cache = LruCache(backend=SqliteStore(path)("shared"))
+    assert sorted(cache.keys()) == list(range(200))
+
+
+def test_cache_stats():
+    cache = LruCache(max_size=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    assert cache.get("c") is None
+    with pytest.raises(KeyError):
+        _ = cache["c"]
+    assert cache.setdefault("a", 0) == 1
+    assert "c" not in cache  # membership tests are not counted
+
+    cache["c"] = 3  # evicts "b"
+    cache.pop("c")
+    cache.pop("c")
+    cache.count_refresh()
+    stats = cache.stats
+    assert stats == CacheStats(
+        hits=2,
+        misses=2,
+        refreshes=1,
+        evictions={"size": 1, "age": 0, "explicit": 1},
+        size=1,
+    )
+    assert stats.hit_ratio == 0.5
+
+    cache.clear()
+    assert cache.stats.evictions["explicit"] == 2
+    cache.reset_stats()
+    assert cache.stats == CacheStats()
+    assert CacheStats().hit_ratio == 0.0
+
+
+def test_cache_stats_age_evictions():
+    cache = LruCache(max_age_s=60)
+    cache.set("a", 1)
+    cache.set("b", 2, validators={"If-None-Match": "etag"})
+    cache.backend.clock = lambda: time.monotonic() + 120
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("b", stale=True) == 2  # not counted
+    cache.evict(max_age_s=60)
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses) == (0, 2)
+    assert stats.evictions == {"size": 0, "age": 2, "explicit": 0}
+
+    total = stats + CacheStats(hits=2, evictions={"size": 1})
+    assert total.hits == 2
+    assert total.evictions == {"size": 1, "age": 2, "explicit": 0}
+
+
+def access_trace(steps=20_000, seed=7):
+    # bots re-read a working set of tickets while searches write pages of results
+    rnd = random.Random(seed)
+    trace = []
+    scanned = 10_000
+    for step in range(steps):
+        if step % 500 == 0:
+            trace.extend(("write", rid) for rid in range(scanned, scanned + 150))
+            scanned += 150
+        if rnd.random() < 0.1:
+            trace.append(("read", rnd.randrange(1000, 3000)))
+        else:
+            trace.append(("read", rnd.randrange(40)))
+    return trace
+
+
+def replay(cache, trace):
+    for operation, key in trace:
+        if operation == "write" or cache.get(key) is None:
+            cache[key] = key
+    return cache.stats.hit_ratio
+
+
+def test_two_queue_policy_resists_scans():
+    cache = LruCache(max_size=8, policy=TwoQueuePolicy())
+    for key in range(4):
+        cache[key] = key
+        _ = cache[key]
+    for key in range(100, 200):
+        cache[key] = key
+
+    assert len(cache) == 8
+    assert all(key in cache for key in range(4))
+
+    del cache[0]
+    cache.max_size = 2
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_two_queue_policy_readmits_evicted_keys():
+    policy = TwoQueuePolicy()
+    cache = LruCache(max_size=4, policy=policy)
+    for key in range(5):
+        cache[key] = key  # 0 is evicted from probation
+    cache[0] = 0  # remembered, goes to the protected queue
+    for key in range(10, 20):
+        cache[key] = key
+    assert 0 in cache
+
+
+def test_policy_can_be_set_later():
+    cache = LruCache(max_size=3)
+    for key in range(3):
+        cache[key] = key
+    cache.policy = TwoQueuePolicy()
+    cache[3] = 3
+    assert list(cache.keys()) == [1, 2, 3]
+
+
+def test_two_queue_hit_ratio_on_trace():
+    trace = access_trace()
+    lru = replay(LruCache(max_size=100), trace)
+    two_queue = replay(LruCache(max_size=100, policy=TwoQueuePolicy()), trace)
+    assert two_queue > lru + 0.05
@@ -2,11 +2,15 @@
 # -*- coding: UTF-8 -*-
 
 import re
+import time
 
 import pytest
+from requests import HTTPError
 
 from zammadoo import APIException
 
+from . import fake_server
+
 
 def test_server_version(rclient):
     assert re.match(r"[5-7]\.\d+(?:\.[\w-]+)+", rclient.server_version)
@@ -110,3 +114,269 @@ def test_impersonation_of(rclient):
             assert users.me().id == 2
 
         assert users.me().id == 1
+
+
+def test_concurrent_identical_gets_are_coalesced(fake_server):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from zammadoo import Client
+
+    client = Client("https://localhost/api/v1", http_token="secret")
+    url = "https://localhost/api/v1/tickets/search"
+    fake_server.add("GET", url, [{"id": 1}], delay_s=0.05)
+    params = [{"query": "state:new"}] * 6 + [{"query": "state:open"}] * 2
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda p: client.get(url, params=p), params))
+        with client.impersonation_of(2):
+            client.get(url, params=params[0])
+
+    assert results == [[{"id": 1}]] * 8
+    assert fake_server.count("GET", url) == 3
+    # every caller can change its own result
+    assert len({id(result) for result in results}) == 8
+    assert len({id(result[0]) for result in results}) == 8
+
+
+def test_impersonation_is_thread_local(fake_server):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from zammadoo import Client
+
+    client = Client("https://localhost/api/v1", http_token="secret")
+    url = "https://localhost/api/v1/users/me"
+    fake_server.add(
+        "GET",
+        url,
+        lambda request: (200, {"id": request.headers.get("X-On-Behalf-Of")}, {}),
+        delay_s=0.02,
+    )
+
+    def whoami(user):
+        if user is None:
+            return client.get(url)["id"]
+        with client.impersonation_of(user):
+            return client.get(url)["id"]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        users = [None, "1", "2", "agent"] * 3
+        assert list(executor.map(whoami, users)) == users
+    assert client.on_behalf_of is None
+
+
+def test_shared_client_throughput_scales_with_threads(fake_server):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from zammadoo import Client
+
+    for uid in range(1, 33):
+        url = f"https://localhost/api/v1/users/{uid}"
+        fake_server.add("GET", url, {"id": uid, "login": str(uid)}, delay_s=0.01)
+
+    def elapsed_s(workers):
+        client = Client("https://localhost/api/v1", http_token="secret")
+        users = client.users
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            logins = list(executor.map(lambda uid: users(uid).login, range(1, 33)))
+        assert logins == [str(uid) for uid in range(1, 33)]
+        return time.perf_counter() - start
+
+    assert elapsed_s(8) < elapsed_s(1) / 3
+
+
+def test_transport_settings_are_mounted():
+    from zammadoo import Client, Transport
+
+    transport = Transport(pool_maxsize=32, retries=5, keep_alive=False)
+    client = Client("https://localhost/api/v1", http_token="token", transport=transport)
+    adapter = client.session.get_adapter(client.url)
+
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 5
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert client.session.headers["Connection"] == "close"
+
+    retry = Transport(retry_post=True).retry()
+    assert {"GET", "PUT", "DELETE", "POST"}.issubset(retry.allowed_methods)
+
+
+@pytest.fixture(scope="function")
+def flaky_server():
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    statuses = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self):
+            status = statuses.pop(0) if statuses else 200
+            body = b'{"status": %d}' % status
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "0")
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = _reply
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", statuses
+    server.shutdown()
+    server.server_close()
+
+
+def test_transport_retries_idempotent_requests(flaky_server):
+    from zammadoo import Client, Transport
+
+    url, statuses = flaky_server
+    transport = Transport(backoff_factor=0)
+    client = Client(url, http_token="token", transport=transport)
+
+    statuses.extend([503, 429])
+    assert client.get("ping") == {"status": 200}
+    assert not statuses
+
+    statuses.extend([503, 200])
+    with pytest.raises(HTTPError):
+        client.post("ping")
+    assert statuses == [200]
+
+
+def test_transport_retries_post_if_enabled(flaky_server):
+    from zammadoo import Client, Transport
+
+    url, statuses = flaky_server
+    transport = Transport(backoff_factor=0, retry_post=True)
+    client = Client(url, http_token="token", transport=transport)
+
+    statuses.extend([502])
+    assert client.post("ping") == {"status": 200}
+
+
+def test_compressed_request_body(fake_server):
+    import gzip
+    import json
+
+    from zammadoo import Client
+
+    url = "https://localhost/api/v1"
+    client = Client(url, http_token="token", compress_requests=100)
+    fake_server.add("POST", f"{url}/tickets", {"id": 1})
+
+    client.post("tickets", json={"title": "small"})
+    client.post("tickets", json={"title": "large", "body": "x" * 1000})
+    small, large = fake_server.requests
+
+    assert "Content-Encoding" not in small.headers
+    assert json.loads(small.body) == {"title": "small"}
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert large.headers["Content-Type"] == "application/json"
+    assert len(large.body) < 100
+    assert json.loads(gzip.decompress(large.body))["body"] == "x" * 1000
+
+
+def test_accept_encoding_and_transfer_logging(caplog, fake_server):
+    import logging
+
+    from zammadoo import Client
+
+    url = "https://localhost/api/v1"
+    client = Client(url, http_token="token")
+    assert "gzip" in client.session.headers["Accept-Encoding"]
+
+    body = {"data": "x" * 95}
+    headers = {"Content-Encoding": "gzip", "Content-Length": "40"}
+    fake_server.add("GET", f"{url}/large", lambda _: (200, body, headers))
+
+    with caplog.at_level(logging.DEBUG, logger="zammadoo"):
+        client.get("large")
+
+    assert (
+        "zammadoo",
+        logging.DEBUG,
+        "HTTP: received 40 bytes gzip encoded, 107 bytes decoded (62.6% saved)",
+    ) in caplog.record_tuples
+
+
+def test_preload_fills_reference_caches(fake_server):
+    from zammadoo import Client
+
+    client = Client("https://localhost/api/v1", http_token="secret")
+    endpoints = (
+        "ticket_states",
+        "ticket_priorities",
+        "groups",
+        "roles",
+        "time_accounting/types",
+    )
+    for endpoint in endpoints:
+        items = [{"id": rid, "name": f"{endpoint} {rid}"} for rid in (1, 2)]
+        fake_server.add("GET", f"{client.url}/{endpoint}", items, delay_s=0.01)
+
+    assert client.preload() == dict.fromkeys(endpoints, 2)
+    assert all("per_page=100" in request.url for request in fake_server.requests)
+
+    requests = len(fake_server.requests)
+    assert client.ticket_states(2).name == "ticket_states 2"
+    assert client.time_accountings.types(1).name == "time_accounting/types 1"
+    assert len(fake_server.requests) == requests
+
+    with pytest.raises(APIException):
+        client.preload(client.organizations)
+
+
+def test_dump_and_load_cache(tmp_path):
+    from zammadoo import Client
+
+    path = tmp_path / "cache.bin"
+    client = Client("https://localhost/api/v1", http_token="secret")
+    backend = client.tickets.cache.backend
+    backend.clock = lambda: time.monotonic() - 30
+    client.tickets(1, info={"id": 1, "title": "old"})
+    backend.clock = time.monotonic
+    client.tickets(2, info={"id": 2, "title": "new"})
+    client.time_accountings.types(3, info={"id": 3, "name": "billable"})
+    client.tags.ticket_cache[1] = ["feedback"]
+    client.tags.cache["feedback"] = {"id": 1, "name": "feedback", "count": 1}
+    client.tags.loaded_at = time.time()
+    client.dump_cache(path)
+
+    worker = Client("https://localhost/api/v1", http_token="secret")
+    assert worker.load_cache(path) == {
+        "tickets.cache": 2,
+        "time_accountings.types.cache": 1,
+        "tags.ticket_cache": 1,
+        "tags.cache": 1,
+    }
+    assert worker.tickets(2).title == "new"
+    assert worker.time_accountings.types(3).name == "billable"
+    assert worker.tags.ticket_cache[1] == ["feedback"]
+    assert "feedback" in worker.tags
+    assert 29 < worker.tickets.cache.age_s(f"{worker.url}/tickets/1") < 31
+    assert list(worker.tickets.cache.keys()) == [
+        f"{worker.url}/tickets/1",
+        f"{worker.url}/tickets/2",
+    ]
+
+    worker = Client("https://localhost/api/v1", http_token="secret")
+    assert worker.load_cache(path, max_age_s=15)["tickets.cache"] == 1
+    assert list(worker.tickets.cache.keys()) == [f"{worker.url}/tickets/2"]
+
+    ticket_cache = client.tags.ticket_cache
+    ticket_cache.restore(1, ["feedback"], ticket_cache.max_age_s + 1)
+    client.dump_cache(path)
+    worker = Client("https://localhost/api/v1", http_token="secret")
+    assert worker.load_cache(path)["tags.ticket_cache"] == 0
+    assert 1 not in worker.tags.ticket_cache
+
+    other = Client("https://example.com/api/v1", http_token="secret")
+    with pytest.raises(ValueError, match="localhost"):
+        other.load_cache(path)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+
+import pytest
+
+from zammadoo import Client
+from zammadoo.codec import CODECS, JsonCodec, available_codecs, get_codec
+
+from . import fake_server
+
+URL = "https://localhost/api/v1"
+
+
+@pytest.mark.parametrize("name", sorted(CODECS))
+def test_codec_round_trip(name):
+    codec = available_codecs().get(name)
+    if codec is None:
+        pytest.skip(f"{name} is not installed")
+
+    data = {"id": 1, "title": "Grüße", "tags": ["a", "b"], "note": None}
+    encoded = codec.dumps(data)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded.decode("utf-8")) == data
+    assert codec.loads(encoded) == data
+
+    with pytest.raises(codec.decode_error):
+        codec.loads(b"<html>")
+
+
+def test_default_codec_is_available():
+    assert get_codec().name in available_codecs()
+    assert get_codec("json").name == "json"
+
+
+def test_client_uses_codec(fake_server):
+    calls = []
+
+    def loads(data: bytes):
+        calls.append("loads")
+        return json.loads(data)
+
+    def dumps(obj) -> bytes:
+        calls.append("dumps")
+        return json.dumps(obj).encode("utf-8")
+
+    codec = JsonCodec("custom", loads, dumps, (ValueError,))
+    client = Client(URL, http_token="token", codec=codec)
+    fake_server.add("POST", f"{URL}/groups", {"id": 1, "name": "foo"})
+
+    assert client.post("groups", json={"name": "foo"}) == {"id": 1, "name": "foo"}
+    assert calls == ["dumps", "loads"]
+    request = fake_server.requests[0]
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.body) == {"name": "foo"}
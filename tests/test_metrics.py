@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import pytest
+
+from zammadoo import APIException
+from zammadoo.metrics import MetricsCollector
+
+from . import fake_server
+
+URL = "https://localhost/api/v1"
+
+
+@pytest.fixture(scope="function")
+def metrics(client):
+    collector = MetricsCollector(buckets=(0.5, 10.0))
+    collector.attach(client)
+    yield collector
+    collector.detach(client)
+
+
+def test_hooks_are_called(client, fake_server):
+    fake_server.add("GET", f"{URL}/users/1", {"id": 1})
+    events = []
+
+    def before_request(method, url, kwargs):
+        kwargs.setdefault("headers", {})["X-Test"] = "1"
+        events.append(("before_request", method, url))
+
+    client.add_hook("before_request", before_request)
+    client.add_hook("after_response", lambda *args: events.append(args[:2]))
+    client.add_hook("on_error", lambda *args: events.append(args[:2]))
+
+    client.get("users", 1)
+    with pytest.raises(APIException):
+        client.get("users", 2)
+
+    assert events == [
+        ("before_request", "GET", f"{URL}/users/1"),
+        ("GET", f"{URL}/users/1"),
+        ("before_request", "GET", f"{URL}/users/2"),
+        ("GET", f"{URL}/users/2"),
+        ("GET", f"{URL}/users/2"),
+    ]
+    assert fake_server.requests[0].headers["X-Test"] == "1"
+
+    with pytest.raises(KeyError):
+        client.add_hook("unknown", print)
+
+
+def test_metrics_collector(client, fake_server, metrics):
+    fake_server.add("GET", f"{URL}/users/1", {"id": 1})
+    fake_server.add("GET", f"{URL}/users/2", {"id": 2})
+
+    users = client.users
+    users(1).reload()
+    users(2).reload()
+    users.cached_info(f"{URL}/users/1", refresh=False)
+    with pytest.raises(APIException):
+        client.get("tickets", 99)
+
+    data = metrics.as_dict()
+    users_info = data["requests"]["GET users/{id}"]
+    assert users_info["count"] == 2
+    assert users_info["errors"] == 0
+    assert users_info["status"] == {200: 2}
+    assert users_info["bytes"] == 2 * len(b'{"id": 1}')
+    assert users_info["wire_bytes"] == users_info["bytes"]
+    assert users_info["latency_buckets"]["+Inf"] == 2
+    assert data["requests"]["GET tickets/{id}"]["errors"] == 1
+    assert data["requests"]["GET tickets/{id}"]["status"] == {404: 1}
+    assert data["cache"] == {"users": {"hits": 1, "misses": 0}}
+
+    text = metrics.prometheus()
+    assert (
+        'zammadoo_requests_total{method="GET",endpoint="users/{id}",status="200"} 2'
+        in text
+    )
+    assert (
+        'zammadoo_request_duration_seconds_bucket{method="GET",endpoint="users/{id}",le="+Inf"} 2'
+        in text
+    )
+
+    metrics.reset()
+    assert metrics.as_dict() == {"requests": {}, "cache": {}}
+
+
+def test_metrics_count_decoded_and_wire_bytes(metrics):
+    from requests import Response
+
+    def response(headers, content):
+        result = Response()
+        result.status_code = 200
+        result.headers.update(headers)
+        result._content = content
+        return result
+
+    body = b'{"id": 1}' * 10
+    url = f"{URL}/users/1"
+    metrics.after_response(
+        "GET",
+        url,
+        response({"Content-Length": "20", "Content-Encoding": "gzip"}, body),
+        0.1,
+    )
+    metrics.after_response(
+        "GET", url, response({"Content-Encoding": "gzip"}, body), 0.1
+    )
+    metrics.after_response("GET", url, response({}, body), 0.1)
+    metrics.after_response("GET", url, response({"Content-Length": "90"}, False), 0.1)
+
+    users_info = metrics.as_dict()["requests"]["GET users/{id}"]
+    assert users_info["bytes"] == 3 * len(body)
+    assert users_info["wire_bytes"] == 20 + len(body) + 90
+    assert (
+        'zammadoo_response_wire_bytes_total{method="GET",endpoint="users/{id}"} 200'
+        in metrics.prometheus()
+    )
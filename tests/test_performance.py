@@ -82,3 +82,136 @@ def test_parent_client(info_user, benchmark):
     benchmark(
         timeit, "user.parent.client", number=TEST_COUNT, globals={"user": info_user}
     )
+
+
+@pytest.fixture(scope="module")
+def recorded_payloads():
+    from io import BytesIO
+    from pathlib import Path
+
+    from tests.recording import ResponsePlayback
+
+    payloads = []
+    for path in sorted(Path(__file__).parent.glob("test_*/*.log")):
+        with path.open("rb") as fd:
+            content = fd.read()
+        for metas in ResponsePlayback.build_index(BytesIO(content)).values():
+            for meta in metas:
+                start = meta["content_start"]
+                payload = content[start : start + meta["content_size"]]
+                if payload[:1] in {b"{", b"["}:
+                    payloads.append(payload)
+
+    payloads.sort(key=len, reverse=True)
+    return payloads[:20]
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec", "ujson"])
+def test_codec_decode_recorded_payloads(recorded_payloads, name, benchmark):
+    from zammadoo.codec import available_codecs
+
+    codec = available_codecs().get(name)
+    if codec is None:
+        pytest.skip(f"{name} is not installed")
+
+    loads = codec.loads
+    assert recorded_payloads
+
+    def decode_all():
+        for payload in recorded_payloads:
+            loads(payload)
+
+    benchmark(decode_all)
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec", "ujson"])
+def test_codec_encode_recorded_payloads(recorded_payloads, name, benchmark):
+    from zammadoo.codec import available_codecs, get_codec
+
+    codec = available_codecs().get(name)
+    if codec is None:
+        pytest.skip(f"{name} is not installed")
+
+    decoded = [get_codec("json").loads(payload) for payload in recorded_payloads]
+    dumps = codec.dumps
+
+    def encode_all():
+        for value in decoded:
+            dumps(value)
+
+    benchmark(encode_all)
+
+
+@pytest.mark.parametrize("size", [1_000, 100_000])
+def test_cache_evict_by_age(size, benchmark):
+    from zammadoo.cache import LruCache
+
+    cache = LruCache()
+    for item in range(size):
+        cache[item] = item
+    for item in range(0, size, 2):
+        _ = cache[item]  # the LRU order differs from the write order
+
+    # nothing has expired, the oldest entry is checked only
+    benchmark(cache.evict, max_age_s=3600)
+    assert len(cache) == size
+
+
+@pytest.mark.parametrize("size", [1_000, 100_000])
+def test_cache_evict_expired_entries(size, benchmark):
+    from itertools import count
+
+    from zammadoo.cache import LruCache
+
+    expired = 100  # the number of entries evicted per round
+    batches = size // expired
+    now = [0.0]
+    cache = LruCache()
+    cache.backend.clock = lambda: now[0]
+    keys = count()
+
+    def write_batch():
+        for _ in range(expired):
+            cache[next(keys)] = None
+
+    for now[0] in range(batches):
+        write_batch()
+    for item in range(0, size, 2):
+        _ = cache[item]  # the LRU order differs from the write order
+
+    def add_batch():
+        now[0] += 1
+        write_batch()
+
+    # every round the oldest batch expires, only these entries are visited,
+    # so the time depends on the number of expired entries but not on the size
+    benchmark.pedantic(
+        cache.evict, kwargs={"max_age_s": batches - 0.5}, setup=add_batch, rounds=50
+    )
+    assert len(cache) == size
+    rounds = now[0] - batches + 1
+    assert cache.stats.evictions["age"] == rounds * expired
+
+
+@pytest.mark.parametrize("policy", ["lru", "2q"])
+def test_cache_policy_replay_trace(policy, benchmark):
+    from tests.test_cache import access_trace, replay
+    from zammadoo.cache import LruCache, TwoQueuePolicy
+
+    trace = access_trace()
+
+    def replay_trace():
+        cache = LruCache(max_size=100)
+        if policy == "2q":
+            cache.policy = TwoQueuePolicy()
+        return replay(cache, trace)
+
+    hit_ratio = benchmark(replay_trace)
+    benchmark.extra_info["hit_ratio"] = hit_ratio
+    assert 0.0 < hit_ratio < 1.0
+
+
+def test_resource_identity_lookup(info_user, benchmark):
+    users = info_user.parent
+    assert users(123) is info_user
+    benchmark(timeit, "users(123)", number=TEST_COUNT, globals={"users": users})
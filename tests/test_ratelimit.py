@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from zammadoo import RateLimiter
+
+from . import fake_server
+
+URL = "https://localhost/api/v1"
+
+
+def test_rate_limiter_allows_burst_then_waits():
+    limiter = RateLimiter(rate=100, burst=3)
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.reserve() == pytest.approx(0.01, abs=0.002)
+    assert limiter.reserve() == pytest.approx(0.02, abs=0.002)
+
+
+def test_rate_limiter_rejects_invalid_rate():
+    with pytest.raises(ValueError, match="greater than 0"):
+        RateLimiter(0)
+
+
+def test_rate_limiter_is_shared_between_threads():
+    limiter = RateLimiter(rate=200, burst=1)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: limiter.acquire(), range(21)))
+    assert time.monotonic() - start >= 0.095
+
+
+def test_client_applies_global_and_endpoint_rate_limits(client, fake_server):
+    fake_server.add("GET", f"{URL}/tickets/search", [])
+    fake_server.add("GET", f"{URL}/users/1", {"id": 1})
+
+    client.rate_limiter = RateLimiter(rate=1000, burst=100)
+    client.rate_limiters["tickets/search"] = RateLimiter(rate=50, burst=1)
+
+    start = time.monotonic()
+    for _ in range(3):
+        client.get("users", 1)
+    assert time.monotonic() - start < 0.02
+
+    start = time.monotonic()
+    for _ in range(3):
+        client.get("tickets", "search", params={"query": "foo"})
+    assert time.monotonic() - start >= 0.039
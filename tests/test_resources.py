@@ -0,0 +1,414 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+"""tests related to classes in `zammadoo.resources` that can be performed offline"""
+
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from . import fake_server
+
+URL = "https://localhost/api/v1"
+
+
+def paginated(count: int):
+    def _route(request):
+        query = parse_qs(urlsplit(request.url).query)
+        page, per_page = int(query["page"][0]), int(query["per_page"][0])
+        start = (page - 1) * per_page + 1
+        stop = min(start + per_page, count + 1)
+        return 200, [{"id": rid} for rid in range(start, stop)], {}
+
+    return _route
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_with_prefetch_yields_all_items_in_order(client, fake_server, prefetch):
+    fake_server.add("GET", f"{URL}/groups", paginated(23), delay_s=0.01)
+
+    groups = list(client.groups.iter(per_page=5, prefetch=prefetch))
+    assert [group.id for group in groups] == list(range(1, 24))
+    assert all("prefetch" not in request.url for request in fake_server.requests)
+    assert fake_server.count("GET", f"{URL}/groups") <= 5 + prefetch
+
+
+def test_iter_with_prefetch_stops_after_short_page(client, fake_server):
+    import time
+
+    route = paginated(25)
+
+    def slow_first_page(request):
+        if "page=1&" in request.url:
+            time.sleep(0.2)
+        return route(request)
+
+    fake_server.add("GET", f"{URL}/groups", slow_first_page)
+
+    groups = list(client.groups.iter(per_page=10, prefetch=4))
+    assert [group.id for group in groups] == list(range(1, 26))
+    # pages 1-4 are requested up front, page 3 is short
+    assert fake_server.count("GET", f"{URL}/groups") == 4
+
+
+def test_iter_with_prefetch_without_per_page(client, fake_server, caplog):
+    def _route(request):
+        page = int(parse_qs(urlsplit(request.url).query)["page"][0])
+        return 200, [{"id": page}] if page < 3 else [], {}
+
+    fake_server.add("GET", f"{URL}/groups", _route)
+    groups = list(client.groups.iter(per_page=None, prefetch=2))
+    assert [group.id for group in groups] == [1, 2]
+    assert "exception calling callback" not in caplog.text
+
+
+def test_iter_with_prefetch_stops_requesting_when_closed(client, fake_server):
+    fake_server.add("GET", f"{URL}/groups", paginated(1000))
+
+    iterator = client.groups.iter(per_page=10, prefetch=2)
+    assert next(iterator).id == 1
+    iterator.close()
+    assert fake_server.count("GET", f"{URL}/groups") <= 3
+
+
+def test_get_many_requests_only_uncached_resources(client, fake_server):
+    users = client.users
+    for uid in range(1, 7):
+        fake_server.add("GET", f"{URL}/users/{uid}", {"id": uid, "login": f"u{uid}"})
+    users(2, info={"id": 2, "login": "cached"})
+
+    result = users.get_many([5, 2, 1, 5, 6], workers=3)
+    assert [user.id for user in result] == [5, 2, 1, 5, 6]
+    assert result[1].login == "cached"
+    assert fake_server.count("GET", f"{URL}/users/2") == 0
+    assert fake_server.count("GET", f"{URL}/users/5") == 1
+    assert f"{URL}/users/6" in users.cache
+
+
+def test_get_many_raises_for_missing_resource(client, fake_server):
+    from zammadoo import APIException
+
+    fake_server.add("GET", f"{URL}/users/1", {"id": 1})
+    with pytest.raises(APIException, match="No route matches"):
+        client.users.get_many([1, 2])
+
+
+def test_cached_info_revalidates_with_etag(client, fake_server):
+    url = f"{URL}/users/1"
+
+    def _route(request):
+        if request.headers.get("If-None-Match") == 'W/"abc"':
+            return 304, None, {"ETag": 'W/"abc"'}
+        return 200, {"id": 1, "login": "john"}, {"ETag": 'W/"abc"'}
+
+    fake_server.add("GET", url, _route)
+    users = client.users
+
+    info = users.cached_info(url)
+    assert users.cache.validators(url) == {"If-None-Match": 'W/"abc"'}
+
+    user = users(1)
+    user.reload()
+    assert user.login == "john"
+    assert users.cached_info(url) is info
+    assert [
+        request.headers.get("If-None-Match") for request in fake_server.requests
+    ] == [
+        None,
+        'W/"abc"',
+        'W/"abc"',
+    ]
+
+
+def test_cached_info_revalidates_the_expanded_variant(client, fake_server):
+    url = f"{URL}/tickets/1"
+    modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    def _route(request):
+        if request.headers.get("If-Modified-Since") == modified:
+            return 304, None, {"Last-Modified": modified}
+        info = {"id": 1, "state_id": 2}
+        if "expand=true" in request.url:
+            info["state"] = "open"
+        return 200, info, {"Last-Modified": modified}
+
+    fake_server.add("GET", url, _route)
+    ticket = client.tickets(1)
+    ticket.reload()
+    ticket.reload(expand=True)
+    assert ticket["state"] == "open"
+    ticket.reload(expand=True)
+    assert ticket["state"] == "open"
+    ticket.reload()
+    assert "state" not in ticket.view()
+    assert [
+        request.headers.get("If-Modified-Since") for request in fake_server.requests
+    ] == [None, None, modified, None]
+    assert client.tickets.cache.validators(url) == {"If-Modified-Since": modified}
+
+
+def test_cached_info_drops_validators_on_setitem(client, fake_server):
+    url = f"{URL}/users/1"
+    fake_server.add("GET", url, lambda _: (200, {"id": 1}, {"ETag": '"1"'}))
+    users = client.users
+
+    users.cached_info(url)
+    users(1, info={"id": 1, "login": "other"})
+    assert users.cache.validators(url) is None
+
+
+def test_concurrent_cached_info_shares_one_request(client, fake_server):
+    from concurrent.futures import ThreadPoolExecutor
+
+    fake_server.add("GET", f"{URL}/users/1", {"id": 1, "login": "-"}, delay_s=0.05)
+    users = client.users
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        logins = list(executor.map(lambda _: users(1).login, range(8)))
+
+    assert logins == ["-"] * 8
+    assert fake_server.count("GET", f"{URL}/users/1") == 1
+
+
+def test_import_csv_in_chunks(client, fake_server, tmp_path):
+    import csv
+    from io import StringIO
+
+    chunks = []
+
+    def _route(request):
+        body = request.body.decode("utf-8")
+        head, data = body.split("\r\n\r\n", 1)
+        assert 'Content-Disposition: form-data; name="file"; filename=' in head
+        data = data.rsplit("\r\n--", 1)[0]
+        rows = list(csv.DictReader(StringIO(data)))
+        chunks.append((parse_qs(urlsplit(request.url).query)["try"], rows))
+        errors = [
+            f"Line {line}: invalid login"
+            for line, row in enumerate(rows, 1)
+            if row["login"] == "bad"
+        ]
+        stats = {"created": len(rows) - len(errors), "updated": 0}
+        return 200, {"stats": stats, "errors": errors, "result": "success"}, {}
+
+    fake_server.add("POST", f"{URL}/users/import", _route)
+    users = [{"login": login, "email": f"{login}@x"} for login in "abcd"]
+    users.insert(3, {"login": "bad"})
+
+    result = client.users.import_csv(iter(users), try_run=True, chunk_size=2)
+    assert result.try_run and not result.ok
+    assert result.rows == 5
+    assert result.stats == {"created": 4, "updated": 0}
+    assert result.errors == ["Line 4: invalid login"]
+    assert [len(rows) for _, rows in chunks] == [2, 2, 1]
+    assert chunks[0][0] == ["true"]
+    assert chunks[1][1][1] == {"login": "bad", "email": ""}
+
+    path = tmp_path / "users.csv"
+    path.write_text('login,note\na,"multi\nline"\nb,\n', encoding="utf-8")
+    chunks.clear()
+    result = client.users.import_csv(path)
+    assert result.ok and result.rows == 2
+    assert chunks == [
+        (["false"], [{"login": "a", "note": "multi\nline"}, {"login": "b", "note": ""}])
+    ]
+
+    assert client.organizations.import_csv([]).rows == 0
+
+
+def test_iter_with_stream_yields_all_items(client, fake_server):
+    fake_server.add("GET", f"{URL}/groups", paginated(23))
+
+    groups = client.groups.iter(per_page=10, stream=True)
+    assert [group.id for group in groups] == list(range(1, 24))
+    assert fake_server.count("GET", f"{URL}/groups") == 3
+    assert f"{URL}/groups/23" in client.groups.cache
+
+    with pytest.raises(ValueError, match="cannot be combined"):
+        next(client.groups.iter(stream=True, prefetch=1))
+
+
+def test_stream_raises_api_exception(client, fake_server):
+    from zammadoo import APIException
+
+    with pytest.raises(APIException, match="No route matches"):
+        list(client.groups.iter(stream=True))
+
+
+def test_persistent_cache_backend(fake_server, tmp_path):
+    from zammadoo import Client
+    from zammadoo.cache import SqliteStore
+
+    fake_server.add("GET", f"{URL}/users/1", {"id": 1, "login": "admin"})
+    store = SqliteStore(tmp_path / "cache.db")
+
+    client = Client(URL, http_token="secret", cache_backend=store)
+    assert client.users(1).login == "admin"
+
+    client = Client(URL, http_token="secret", cache_backend=store)
+    user = client.users(1)
+    assert user.login == "admin"
+    assert fake_server.count("GET", f"{URL}/users/1") == 1
+
+    # unchanged entries are not read and copied again
+    info = user._info
+    assert client.users(1)._info is info
+    client.users.cache[user.url] = {"id": 1, "login": "root"}
+    assert client.users(1).login == "root"
+
+
+def test_cache_ttl_expires_resources(client, fake_server):
+    from zammadoo.resources import ResourcesT
+    from zammadoo.tickets import States, Tickets
+
+    assert ResourcesT.DEFAULT_CACHE_TTL is None
+    assert client.ticket_states.cache.max_age_s == States.DEFAULT_CACHE_TTL
+    assert client.tickets.cache.max_age_s == Tickets.DEFAULT_CACHE_TTL
+
+    url = f"{URL}/users/1"
+    fake_server.add(
+        "GET", url, lambda _: (200, {"id": 1, "login": "-"}, {"ETag": '"1"'})
+    )
+    users = client.users
+    users.cache.max_age_s = 0.01
+
+    assert users(1).login == "-"
+    assert users(1).login == "-"
+    time.sleep(0.015)
+    assert users(1).login == "-"
+    assert [
+        request.headers.get("If-None-Match") for request in fake_server.requests
+    ] == [None, '"1"']
+
+
+def test_client_cache_footprint(client):
+    assert client.cache_footprint() == {}
+
+    client.users(1, info={"id": 1, "login": "admin"})
+    client.time_accountings.types(1, info={"id": 1, "name": "billable"})
+    footprint = client.cache_footprint()
+    assert set(footprint) == {"users", "time_accountings", "time_accounting/types"}
+    assert footprint["users"] == client.users.cache.nbytes > 0
+    assert footprint["time_accountings"] == 0
+
+    client.tags.ticket_cache[1] = ["feedback"]
+    assert client.cache_footprint()["tags.ticket_cache"] > 0
+
+
+def test_client_cache_stats(client, fake_server):
+    fake_server.add(
+        "GET", f"{URL}/users/1", lambda _: (200, {"id": 1, "login": "-"}, {})
+    )
+    users = client.users
+
+    assert users(1).login == "-"
+    assert users(1).login == "-"
+    users(1).reload()
+    users.get_many([1, 1])
+
+    stats = client.cache_stats()
+    assert set(stats) == {"users"}
+    assert (stats["users"].hits, stats["users"].misses) == (2, 1)
+    assert stats["users"].refreshes == 1
+    assert stats["users"].size == 1
+
+    ticket_cache = client.tags.ticket_cache
+    ticket_cache[1] = ["feedback"]
+    assert ticket_cache.get(1) == ["feedback"]
+    stats = client.cache_stats()
+    assert set(stats) == {"users", "tags.ticket_cache"}
+    assert (stats["tags.ticket_cache"].hits, stats["tags.ticket_cache"].size) == (1, 1)
+
+
+def test_iter_without_cache(client, fake_server):
+    fake_server.add("GET", f"{URL}/groups", paginated(3))
+    groups = list(client.groups.iter(cache=False))
+    assert [group["id"] for group in groups] == [1, 2, 3]
+    assert len(client.groups.cache) == 0
+    assert "cache" not in fake_server.requests[0].url
+
+
+def test_uncached_resources_keep_their_properties(client, fake_server):
+    fake_server.add("GET", f"{URL}/groups", paginated(1))
+    groups = client.groups
+    (group,) = groups.iter(cache=False)
+    assert groups(1) is group
+    assert group["id"] == 1
+
+    users = groups.client.users
+    users.cache.max_size = 0
+    user = users(2, info={"id": 2, "login": "admin"})
+    assert users(2) is user
+    assert user.login == "admin"
+    assert len(fake_server.requests) == 1
+
+
+def test_negative_cache_for_missing_resources(client, fake_server):
+    from zammadoo.client import APIException
+
+    url = f"{URL}/users/5"
+    fake_server.add("GET", url, lambda _: (404, {"error": "not found"}, {}))
+    users = client.users
+    assert users.missing.max_age_s is None
+
+    for _ in range(2):
+        with pytest.raises(APIException, match="not found"):
+            _ = users(5).login
+    assert fake_server.count("GET", url) == 2
+
+    users.missing.max_age_s = 0.05
+    errors = []
+    for _ in range(2):
+        with pytest.raises(APIException, match="not found") as exc_info:
+            _ = users(5).login
+        errors.append(exc_info.value)
+    assert errors[0] is not errors[1]
+    assert errors[1].response is errors[0].response
+    with pytest.raises(APIException, match="not found"):
+        users.get_many([5])
+    assert fake_server.count("GET", url) == 3
+
+    time.sleep(0.06)
+    with pytest.raises(APIException, match="not found"):
+        _ = users(5).login
+    assert fake_server.count("GET", url) == 4
+
+    users(5, info={"id": 5, "login": "back"})
+    assert users(5).login == "back"
+    assert fake_server.count("GET", url) == 4
+
+
+def test_resources_are_unique_and_hashable(client):
+    import gc
+    import weakref
+
+    users = client.users
+    user = users(1, info={"id": 1, "login": "old"})
+    assert users(1) is user
+    assert users(1, info={"id": 1, "login": "new"}) is user
+    assert user.login == "new"
+
+    other = users(2, info={"id": 2, "login": "other"})
+    assert {user, users(1), other} == {user, other}
+    assert {user: 1}[users(1)] == 1
+    assert hash(user) == hash(user.url)
+
+    ref = weakref.ref(user)
+    del user
+    gc.collect()
+    assert ref() is None
+    assert users(1).login == "new"  # from cache
+
+
+def test_get_many_keeps_cached_entries(client, fake_server):
+    url = f"{URL}/users/1"
+    users = client.users
+    users.cache.set(url, {"id": 1, "login": "cached"}, {"If-None-Match": '"v1"'})
+    users.cache.backend.clock = lambda: time.monotonic() + 30
+
+    (user,) = users.get_many([1])
+    assert user.login == "cached"
+    assert users.cache.validators(url) == {"If-None-Match": '"v1"'}
+    assert users.cache.age_s(url) >= 30
+    assert not fake_server.requests
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+import time
+
+import pytest
+
+from zammadoo.snapshot import read_snapshot, write_snapshot
+
+
+def dumps(value):
+    return json.dumps(value).encode()
+
+
+def test_snapshot_roundtrip(tmp_path):
+    path = tmp_path / "cache.bin"
+    now = time.time()
+    sections = [
+        (
+            "tickets.cache",
+            [
+                ("https://localhost/api/v1/tickets/2", now - 10, {"id": 2}, None),
+                (
+                    "https://localhost/api/v1/tickets/1",
+                    now - 20,
+                    {"id": 1},
+                    {"If-None-Match": '"1"'},
+                ),
+            ],
+        ),
+        ("tags.ticket_cache", [(7, now, ["täg"], None)]),
+        ("users.cache", []),
+    ]
+    write_snapshot(path, "https://localhost/api/v1", sections, dumps)
+
+    url, loaded = read_snapshot(path, json.loads)
+    assert url == "https://localhost/api/v1"
+    assert list(loaded) == ["tickets.cache", "tags.ticket_cache", "users.cache"]
+    # ordered by write time
+    assert loaded["tickets.cache"] == sections[0][1][::-1]
+    assert loaded["tags.ticket_cache"] == sections[1][1]
+    assert loaded["users.cache"] == []
+
+    _, loaded = read_snapshot(path, json.loads, min_written_at=now - 15)
+    assert [entry[0] for entry in loaded["tickets.cache"]] == [
+        "https://localhost/api/v1/tickets/2"
+    ]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.parametrize("content", [b"", b"not a cache snapshot file"])
+def test_read_invalid_snapshot(tmp_path, content):
+    path = tmp_path / "cache.bin"
+    path.write_bytes(content)
+    with pytest.raises(ValueError, match="no cache snapshot"):
+        read_snapshot(path, json.loads)
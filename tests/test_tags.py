@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 
-from . import assert_existing_tags
+from . import assert_existing_tags, fake_server
 
 
 def test_representation_of_tags(client_url, client):
@@ -62,3 +62,59 @@ def test_delete_tag(rclient, assert_existing_tags):
     with assert_existing_tags(tag_name):
         tags.delete(tag_name)
         assert tag_name not in tags
+
+
+def test_apply_tag_changes(client, fake_server):
+    import json
+
+    from zammadoo import APIException
+
+    url = client.url
+
+    def tag_route(request):
+        body = json.loads(request.body)
+        if body["o_id"] == 3:
+            return 422, {"error": "not allowed"}, {}
+        return 200, True, {}
+
+    fake_server.add("POST", f"{url}/tags/add", tag_route)
+    fake_server.add("DELETE", f"{url}/tags/remove", tag_route)
+    fake_server.add("GET", f"{url}/tags", {"tags": ["foo", "bar"]})
+    tags = client.tags
+    tags.by_ticket(1)
+
+    result = tags.apply(
+        {
+            1: {"add": ["foo"], "remove": ["baz"]},
+            2: {"add": ["foo", "foo"], "remove": ["bar"]},
+            3: {"add": ["foo"]},
+            4: {},
+        },
+        workers=2,
+    )
+
+    assert result.succeeded == [2]
+    assert result.unchanged == [1, 4]
+    assert list(result.failed) == [3]
+    assert isinstance(result.failed[3], APIException)
+    assert not result.ok
+    assert fake_server.count("POST", f"{url}/tags/add") == 2
+    assert fake_server.count("DELETE", f"{url}/tags/remove") == 1
+
+    tags.apply({1: {"add": ["new"], "remove": ["foo"]}})
+    assert tags.ticket_cache[1] == ["bar", "new"]
+
+
+def test_apply_ignores_expired_ticket_tags(client, fake_server):
+    url = client.url
+    fake_server.add("POST", f"{url}/tags/add", True)
+    tags = client.tags
+    ticket_cache = tags.ticket_cache
+    assert ticket_cache.max_size == tags.DEFAULT_TICKET_CACHE_SIZE
+    assert ticket_cache.max_age_s == tags.DEFAULT_TICKET_CACHE_TTL
+
+    ticket_cache.restore(1, ["foo"], tags.DEFAULT_TICKET_CACHE_TTL + 1)
+    result = tags.apply({1: {"add": ["foo"]}})
+
+    assert result.succeeded == [1]
+    assert fake_server.count("POST", f"{url}/tags/add") == 1
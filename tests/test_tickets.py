@@ -5,7 +5,7 @@ import time
 
 import pytest
 
-from . import assert_existing_tags, single_ticket, ticket_pair
+from . import assert_existing_tags, fake_server, single_ticket, ticket_pair
 
 
 def test_ticket_customer_attribute(client):
@@ -212,3 +212,104 @@ def test_lazy_attribute_caching(caplog, rclient):
         ("zammadoo", logging.INFO, f"HTTP:GET {api_url}/tickets/1"),
         ("zammadoo", logging.INFO, f"HTTP:GET {api_url}/tickets/1?expand=true"),
     ]
+
+
+def test_tickets_update_many(client, fake_server):
+    import json
+
+    from zammadoo import APIException
+
+    url = client.tickets.url
+    for tid in (1, 2):
+
+        def _route(request, tid=tid):
+            return 200, {"id": tid, **json.loads(request.body)}, {}
+
+        fake_server.add("PUT", f"{url}/{tid}", _route)
+
+    article = {"type": "note"}
+    result = client.tickets.update_many(
+        [
+            (1, {"state": "closed", "body": "done", "article": article}),
+            (client.tickets(2), {"state": "open"}),
+            (3, {"state": "closed"}),
+        ],
+        workers=3,
+    )
+
+    assert result.succeeded == [1, 2]
+    assert list(result.failed) == [3]
+    assert isinstance(result.failed[3], APIException)
+    assert article == {"type": "note"}
+    info = client.tickets.cache[f"{url}/1"]
+    assert info["state"] == "closed"
+    assert info["article"] == {"type": "note", "body": "done", "internal": True}
+    assert client.tickets.cache[f"{url}/2"]["state"] == "open"
+
+
+def test_ticket_iter_history(client, fake_server):
+    history = [{"id": n, "type": "updated"} for n in range(5)]
+    fake_server.add(
+        "GET",
+        f"{client.url}/ticket_history/12",
+        {"history": history, "assets": {"User": {}}},
+    )
+
+    assert list(client.tickets(12).iter_history()) == history
+
+
+def test_ticket_search_without_cache(client, fake_server):
+    fake_server.add(
+        "GET",
+        f"{client.url}/tickets/search",
+        {
+            "tickets": [1, 2],
+            "assets": {
+                "Ticket": {
+                    "1": {"id": 1, "title": "one"},
+                    "2": {"id": 2, "title": "two"},
+                },
+                "User": {"3": {"id": 3, "login": "agent"}},
+            },
+        },
+    )
+
+    tickets = list(client.tickets.search("title:*", cache=False, per_page=10))
+    assert [ticket.title for ticket in tickets] == ["one", "two"]
+    assert len(client.tickets.cache) == 0
+    assert len(client.users.cache) == 0
+
+    list(client.tickets.search("title:*", per_page=10))
+    assert len(client.tickets.cache) == 2
+    assert len(client.users.cache) == 1
+
+
+def test_held_ticket_follows_search_results(client, fake_server):
+    ticket = client.tickets(1, info={"id": 1, "title": "old"})
+    fake_server.add(
+        "GET",
+        f"{client.url}/tickets/search",
+        {"tickets": [1], "assets": {"Ticket": {"1": {"id": 1, "title": "new"}}}},
+    )
+
+    (found,) = client.tickets.search("title:*", per_page=10)
+    assert found is ticket
+    assert ticket.title == "new"
+
+
+def test_held_ticket_follows_cache_expiry(client, fake_server):
+    url = f"{client.url}/tickets/1"
+    fake_server.add("GET", url, {"id": 1, "title": "fetched"})
+    tickets = client.tickets
+    tickets.cache.max_age_s = 0.01
+
+    ticket = tickets(1, info={"id": 1, "title": "old"})
+    time.sleep(0.015)
+    assert tickets(1) is ticket
+    assert tickets(1).title == "fetched"
+    assert fake_server.count("GET", url) == 1
+
+    tickets.cache.clear()
+    fake_server.add("GET", url, {"id": 1, "title": "fetched again"})
+    assert tickets(1).title == "fetched again"
+    assert ticket.title == "fetched again"
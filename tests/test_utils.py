@@ -1,7 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 
-from zammadoo.utils import YieldCounter
+import json
+import threading
+import time
+
+import pytest
+
+from zammadoo.utils import SingleFlight, YieldCounter, iter_json_array
 
 
 def test_yield_counter():
@@ -19,3 +25,72 @@ def test_yield_counter():
 
     next(iter(counter([1, 2, 3])))
     assert counter.yielded == 1
+
+
+def test_single_flight_shares_exceptions():
+    single_flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def failing():
+        calls.append(1)
+        started.set()
+        release.wait(1)
+        raise ValueError("failed")
+
+    errors = []
+
+    def call():
+        try:
+            single_flight("key", failing)
+        except ValueError as exc:
+            errors.append(exc)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(1)
+    followers = [threading.Thread(target=call) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)  # let the followers wait for the leader
+    release.set()
+    for thread in (leader, *followers):
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(errors) == 4
+    assert single_flight("key", lambda: 42) == 42
+
+
+def chunked(data: bytes, size: int):
+    return [data[pos : pos + size] for pos in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 4096])
+def test_iter_json_array(chunk_size):
+    items = [
+        {"id": n, "text": 'quote " slash \\ ,]}{[ ' + "ü" * n, "list": [1, {"a": []}]}
+        for n in range(20)
+    ]
+    items += [1, "two", None, [], {}]
+
+    data = json.dumps(items).encode("utf-8")
+    assert list(iter_json_array(chunked(data, chunk_size))) == items
+
+    document = {"tag": "history", "other": [0], "history": items, "assets": {}}
+    data = json.dumps(document).encode("utf-8")
+    assert list(iter_json_array(chunked(data, chunk_size), key="history")) == items
+
+
+@pytest.mark.parametrize(
+    "data, key, message",
+    [
+        (b'{"a": 1}', None, "expected a JSON array"),
+        (b"[1, 2", None, "incomplete or missing JSON array"),
+        (b"[1]", "history", "expected a JSON object"),
+        (b'{"a": [1]}', "history", "missing JSON array 'history'"),
+    ],
+)
+def test_iter_json_array_raises(data, key, message):
+    with pytest.raises(ValueError, match=message):
+        list(iter_json_array([data], key=key))
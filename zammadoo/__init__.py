@@ -3,8 +3,9 @@
 
 __version__ = "0.4.0.dev1"
 
-from .client import LOG, APIException, Client
+from .client import LOG, APIException, Client, Transport
+from .ratelimit import RateLimiter
 
 LOG.name = __name__
 
-__all__ = ["Client", "APIException", "LOG"]
+__all__ = ["Client", "APIException", "LOG", "RateLimiter", "Transport"]
@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import copy_context
+from functools import cached_property, partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from .client import Client, Transport
+from .resources import ResourcesT
+
+if TYPE_CHECKING:
+    from .articles import Article
+    from .groups import Group
+    from .notifications import Notification
+    from .organizations import Organization
+    from .resource import Resource
+    from .roles import Role
+    from .tickets import Priority, State, Ticket
+    from .time_accountings import TimeAccounting
+    from .users import User
+    from .utils import JsonDict, JsonType, StringKeyMapping
+
+_T = TypeVar("_T")
+_T_co = TypeVar("_T_co", bound="Resource", covariant=True)
+_SENTINEL: Any = object()
+
+
+class AsyncProxy:
+    """AsyncProxy(...)
+
+    Wraps a synchronous manager object: every public method becomes a coroutine
+    function that runs in the executor of the owning :class:`AsyncClient`.
+    """
+
+    def __init__(self, client: "AsyncClient", wrapped: Any) -> None:
+        self.aclient = client
+        self.sync = wrapped  #: the wrapped synchronous object
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} {self.sync!r}>"
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self.sync, name)
+        if isinstance(value, ResourcesT):
+            return AsyncResources(self.aclient, value)
+        if name.startswith("_") or not callable(value):
+            return value
+
+        async def _method(*args, **kwargs):
+            return await self.aclient.run(value, *args, **kwargs)
+
+        _method.__name__ = name
+        _method.__doc__ = value.__doc__
+        return _method
+
+
+class AsyncResources(AsyncProxy, Generic[_T_co]):
+    """AsyncResources(...)
+
+    The asynchronous counterpart of a resource manager. Creating resource objects
+    is done without I/O and returns the same types as the synchronous client, all
+    requests have to be awaited.
+    """
+
+    sync: ResourcesT[_T_co]
+
+    def __call__(self, rid: int, *, info: Optional["JsonDict"] = None) -> _T_co:
+        return self.sync(rid, info=info)
+
+    @property
+    def url(self) -> str:
+        return self.sync.url
+
+    async def cached_info(self, url: str, refresh=True, expand=False) -> "JsonDict":
+        return await self.aclient.run(
+            self.sync.cached_info, url, refresh=refresh, expand=expand
+        )
+
+    async def get(self, rid: int, *, refresh=False, expand=False) -> _T_co:
+        """
+        Return the resource with all its properties loaded.
+
+        :param rid: the resource id
+        :param refresh: if ``True`` the cache is bypassed
+        :param expand: request the resource with additional properties
+        """
+        sync = self.sync
+        info = await self.cached_info(f"{sync.url}/{rid}", refresh, expand)
+        return sync(rid, info=info)
+
+    async def update(self, resource: Union[int, "Resource"], **kwargs) -> _T_co:
+        """
+        Update the resource properties.
+
+        :param resource: the resource or its id
+        :param kwargs: values to be updated (depending on the resource)
+        :return: the updated resource (the same object while it is referenced)
+        """
+        if isinstance(resource, int):
+            resource = self.sync(resource)
+        updated: _T_co = await self.aclient.run(getattr(resource, "update"), **kwargs)
+        return updated
+
+    def iter(self, *args, **params) -> AsyncIterator[_T_co]:
+        """
+        The asynchronous version of :meth:`IterableT.iter`::
+
+            async for ticket in aclient.tickets.iter(per_page=50):
+                print(ticket)
+        """
+        return self.aclient.iterate(
+            partial(getattr(self.sync, "iter"), *args, **params)
+        )
+
+    def search(self, query: str, **params) -> AsyncIterator[_T_co]:
+        """The asynchronous version of :meth:`SearchableT.search`."""
+        return self.aclient.iterate(
+            partial(getattr(self.sync, "search"), query, **params)
+        )
+
+    def __aiter__(self) -> AsyncIterator[_T_co]:
+        return self.iter()
+
+
+class AsyncClient:  # pylint: disable=too-many-public-methods
+    """
+    An :mod:`asyncio` front end for :class:`Client` with the same set of managers.
+
+    The blocking HTTP requests are executed in a bounded thread pool, so a single
+    event loop can drive many API calls concurrently while sharing the resource
+    caches of the underlying client.
+
+    *Example*::
+
+        async with AsyncClient("https://myhost.com/api/v1/", http_token="<secret>") as aclient:
+            tickets = await asyncio.gather(*(aclient.tickets.get(tid) for tid in range(1, 101)))
+
+            async for user in aclient.users.search("role_ids:2"):
+                print(user.fullname)
+
+    The returned resources are the objects of the synchronous client. Properties
+    that are not loaded yet are requested on attribute access, which blocks the
+    event loop. Load them with :meth:`AsyncResources.get` or access them in the
+    executor::
+
+        ticket = await aclient.tickets.get(1)  # all properties loaded
+        state = await aclient.run(lambda: ticket.state.name)
+
+    """
+
+    def __init__(self, url: str, *, max_concurrency: int = 10, **kwargs) -> None:
+        """
+        :param url: the zammad API url (e.g. ``https://myhost.com/api/v1``)
+        :param max_concurrency: the maximum number of requests in flight
+        :param kwargs: additional arguments passed to :class:`Client`
+        """
+        kwargs.setdefault(
+            "transport",
+            Transport(pool_maxsize=max_concurrency),
+        )
+        self.client: Client = Client(url, **kwargs)  #: the synchronous client
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="zammadoo"
+        )
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} {self.client.url!r}>"
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """shut down the worker threads and close the HTTP session"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
+        self.client.session.close()
+
+    @property
+    def url(self) -> str:
+        return self.client.url
+
+    @contextmanager
+    def impersonation_of(self, user: Union[str, int]):
+        """
+        Temporarily perform requests on behalf of another user,
+        see :meth:`Client.impersonation_of`::
+
+            with aclient.impersonation_of(1):
+                print((await aclient.users.me()).id)  # output: 1
+
+        The impersonation only applies to the current asyncio task.
+
+        :param user: user id or login_name
+        """
+        with self.client.impersonation_of(user):
+            yield
+
+    async def run(self, func: Callable[..., _T], *args, **kwargs) -> _T:
+        """
+        run a blocking function in the clients executor and await its result,
+        the function runs in a copy of the current context (e.g. the impersonation)
+        """
+        loop = asyncio.get_running_loop()
+        context = copy_context()
+        return await loop.run_in_executor(
+            self._executor, partial(context.run, func, *args, **kwargs)
+        )
+
+    async def iterate(self, factory: Callable[[], Iterator[_T]]) -> AsyncIterator[_T]:
+        """
+        iterate asynchronously over a blocking iterator created by ``factory``,
+        every step is executed in the clients executor
+        """
+        iterator = await self.run(factory)
+        try:
+            while True:
+                item = await self.run(next, iterator, _SENTINEL)
+                if item is _SENTINEL:
+                    return
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await self.run(close)
+
+    async def request(self, method: str, *args, **kwargs) -> "JsonType":
+        """the asynchronous version of :meth:`Client.request`"""
+        return await self.run(self.client.request, method, *args, **kwargs)
+
+    async def get(self, *args, params: Optional["StringKeyMapping"] = None) -> Any:
+        """shortcut for :meth:`request` with parameter ``("GET", *args, params)``"""
+        return await self.request("GET", *args, params=params)
+
+    async def post(self, *args, json: Optional["StringKeyMapping"] = None) -> Any:
+        """shortcut for :meth:`request` with parameter ``("POST", *args, json)``"""
+        return await self.request("POST", *args, json=json)
+
+    async def put(self, *args, json: Optional["StringKeyMapping"] = None) -> Any:
+        """shortcut for :meth:`request` with parameter ``("PUT", *args, json)``"""
+        return await self.request("PUT", *args, json=json)
+
+    async def delete(self, *args, json: Optional["StringKeyMapping"] = None) -> Any:
+        """shortcut for :meth:`request` with parameter ``("DELETE", *args, json)``"""
+        return await self.request("DELETE", *args, json=json)
+
+    @cached_property
+    def groups(self) -> AsyncResources["Group"]:
+        """Manages the ``/groups`` endpoint."""
+        return AsyncResources(self, self.client.groups)
+
+    @cached_property
+    def notificatons(self) -> AsyncResources["Notification"]:
+        """Manages the ``/online_notifications`` endpoint."""
+        return AsyncResources(self, self.client.notificatons)
+
+    @cached_property
+    def organizations(self) -> AsyncResources["Organization"]:
+        """Manages the ``/organizations`` endpoint."""
+        return AsyncResources(self, self.client.organizations)
+
+    @cached_property
+    def roles(self) -> AsyncResources["Role"]:
+        """Manages the ``/roles`` endpoint."""
+        return AsyncResources(self, self.client.roles)
+
+    @cached_property
+    def tags(self) -> AsyncProxy:
+        """Manages the ``/tags``, ``/tag_list``, ``/tag_search`` endpoint."""
+        return AsyncProxy(self, self.client.tags)
+
+    @cached_property
+    def ticket_articles(self) -> AsyncResources["Article"]:
+        """Manages the ``/ticket_articles`` endpoint."""
+        return AsyncResources(self, self.client.ticket_articles)
+
+    @cached_property
+    def ticket_priorities(self) -> AsyncResources["Priority"]:
+        """Manages the ``/ticket_priorities`` endpoint."""
+        return AsyncResources(self, self.client.ticket_priorities)
+
+    @cached_property
+    def ticket_states(self) -> AsyncResources["State"]:
+        """Manages the ``/ticket_states`` endpoint."""
+        return AsyncResources(self, self.client.ticket_states)
+
+    @cached_property
+    def tickets(self) -> AsyncResources["Ticket"]:
+        """Manages the ``/tickets`` endpoint."""
+        return AsyncResources(self, self.client.tickets)
+
+    @cached_property
+    def time_accountings(self) -> AsyncResources["TimeAccounting"]:
+        """Manages the ``/time_accountings`` endpoint."""
+        return AsyncResources(self, self.client.time_accountings)
+
+    @cached_property
+    def users(self) -> AsyncResources["User"]:
+        """Manages the ``/users`` endpoint."""
+        return AsyncResources(self, self.client.users)
@@ -1,17 +1,572 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
+import json
+import os
+import sqlite3
+import sys
+import threading
+from abc import ABC, abstractmethod
 from collections import OrderedDict
 from collections.abc import Hashable
-from time import monotonic
-from typing import Generic, Optional, Tuple, TypeVar, Union
+from dataclasses import dataclass, field
+from threading import RLock
+from time import monotonic, time, time_ns
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 _T = TypeVar("_T")
+Validators = Dict[str, str]
+#: a cache entry: timestamp of the last write, value and validators
+Entry = Tuple[float, Any, Optional[Validators]]
 
 
+class CacheBackend(ABC):
+    """
+    Stores the entries of a :class:`LruCache` ordered from the least
+    to the most recently used. The cache serializes all calls of a backend.
+    """
+
+    #: returns the timestamps of the entries in seconds
+    clock: Callable[[], float] = staticmethod(monotonic)
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def __contains__(self, key: Hashable) -> bool: ...
+
+    @abstractmethod
+    def get(self, key: Hashable, touch: bool = True) -> Optional[Entry]:
+        """:return: the entry or ``None``, if ``touch`` it becomes the most recent"""
+
+    @abstractmethod
+    def set(self, key: Hashable, entry: Entry) -> None:
+        """store the entry as the most recent one"""
+
+    @abstractmethod
+    def pop(self, key: Hashable) -> Optional[Entry]:
+        """remove and :return: the entry or ``None``"""
+
+    @abstractmethod
+    def pop_lru(self, count: int) -> List[Hashable]:
+        """remove the ``count`` least recently used entries and :return: their keys"""
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def items(self) -> List[Tuple[Hashable, Entry]]:
+        """:return: all keys and entries from the least to the most recently used"""
+
+    def written_at(self, key: Hashable) -> Optional[float]:
+        """:return: the timestamp of the entry or ``None``, without reading its value"""
+        entry = self.get(key, touch=False)
+        return None if entry is None else entry[0]
+
+    def pop_older(self, timestamp: float) -> List[Hashable]:
+        """remove all entries written before the timestamp and :return: their keys"""
+        keys = [key for key, entry in self.items() if entry[0] < timestamp]
+        for key in keys:
+            self.pop(key)
+        return keys
+
+
+class MemoryBackend(CacheBackend):
+    """the default backend that keeps the entries in memory"""
+
+    def __init__(self) -> None:
+        self._entries: "OrderedDict[Hashable, Entry]" = OrderedDict()
+        # the timestamps in write order, allows age eviction without a full scan
+        self._written: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._write_ordered = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, touch: bool = True) -> Optional[Entry]:
+        entries = self._entries
+        entry = entries.get(key)
+        if touch and entry is not None:
+            entries.move_to_end(key)
+        return entry
+
+    def set(self, key: Hashable, entry: Entry) -> None:
+        entries = self._entries
+        entries[key] = entry
+        entries.move_to_end(key)
+
+        written = self._written
+        written.pop(key, None)
+        if written and entry[0] < next(reversed(written.values())):
+            self._write_ordered = False
+        written[key] = entry[0]
+
+    def written_at(self, key: Hashable) -> Optional[float]:
+        return self._written.get(key)
+
+    def pop(self, key: Hashable) -> Optional[Entry]:
+        self._written.pop(key, None)
+        return self._entries.pop(key, None)
+
+    def pop_lru(self, count: int) -> List[Hashable]:
+        entries = self._entries
+        written = self._written
+        keys = []
+        for _ in range(min(count, len(entries))):
+            key, _ = entries.popitem(last=False)
+            del written[key]
+            keys.append(key)
+        return keys
+
+    def pop_older(self, timestamp: float) -> List[Hashable]:
+        written = self._written
+        if not self._write_ordered:
+            # entries were set with older timestamps, restore the order once
+            self._written = written = OrderedDict(
+                sorted(written.items(), key=lambda item: item[1])
+            )
+            self._write_ordered = True
+
+        entries = self._entries
+        keys = []
+        while written:
+            key, written_at = next(iter(written.items()))
+            if written_at >= timestamp:
+                break
+            del written[key]
+            del entries[key]
+            keys.append(key)
+        return keys
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._written.clear()
+
+    def items(self) -> List[Tuple[Hashable, Entry]]:
+        return list(self._entries.items())
+
+
+class SqliteStore:
+    """
+    A persistent cache storage in a SQLite database file. Pass it as
+    ``cache_backend`` to :class:`zammadoo.Client` to keep the resource caches
+    between program runs::
+
+        client = Client(url, http_token=token, cache_backend=SqliteStore("zammad.db"))
+
+    The file can be shared by several threads and processes at the same time.
+    Every resource manager uses its own namespace (its URL), the cached values
+    have to be JSON serializable.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        timeout: float = 30.0,
+        touch_interval_s: float = 1.0,
+    ) -> None:
+        """
+        :param path: the database file
+        :param timeout: seconds to wait for a lock held by another process
+        :param touch_interval_s: the last use of an entry is written at most once
+                                 in this interval, so cache hits rarely need the
+                                 write lock, the LRU order is approximate within it
+        """
+        self.path = os.fspath(path)
+        self.timeout = timeout
+        self.touch_interval_s = touch_interval_s
+        self._local = threading.local()
+        connection = self.connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache (namespace TEXT, key TEXT, "
+            "created REAL, used INTEGER, value TEXT, validators TEXT, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS cache_used ON cache (namespace, used)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS cache_created ON cache (namespace, created)"
+        )
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} {self.path!r}>"
+
+    def __call__(self, namespace: str) -> "SqliteBackend":
+        """:return: the backend for a namespace"""
+        return SqliteBackend(self, namespace)
+
+    def connection(self) -> sqlite3.Connection:
+        """:return: the database connection of the current thread"""
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            self._local.connection = connection
+        return connection
+
+
+class SqliteBackend(CacheBackend):
+    """SqliteBackend(...)
+
+    The backend of one namespace in a :class:`SqliteStore`, the timestamps
+    are wall clock times.
+    """
+
+    clock = staticmethod(time)
+
+    def __init__(self, store: SqliteStore, namespace: str) -> None:
+        self.store = store
+        self.namespace = namespace
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} {self.namespace!r} in {self.store!r}>"
+
+    def _execute(self, sql: str, *params: Any) -> sqlite3.Cursor:
+        return self.store.connection().execute(sql, (self.namespace, *params))
+
+    def __len__(self) -> int:
+        (count,) = self._execute(
+            "SELECT COUNT(*) FROM cache WHERE namespace = ?"
+        ).fetchone()
+        return int(count)
+
+    def __contains__(self, key: Hashable) -> bool:
+        row = self._execute(
+            "SELECT 1 FROM cache WHERE namespace = ? AND key = ?", json.dumps(key)
+        ).fetchone()
+        return row is not None
+
+    def get(self, key: Hashable, touch: bool = True) -> Optional[Entry]:
+        encoded_key = json.dumps(key)
+        row = self._execute(
+            "SELECT created, value, validators, used FROM cache "
+            "WHERE namespace = ? AND key = ?",
+            encoded_key,
+        ).fetchone()
+        if row is None:
+            return None
+        now = time_ns()
+        if touch and now - row[3] >= self.store.touch_interval_s * 1e9:
+            self._execute(
+                "UPDATE cache SET used = ?3 WHERE namespace = ?1 AND key = ?2",
+                encoded_key,
+                now,
+            )
+        return _decode_row(row[:3])
+
+    def written_at(self, key: Hashable) -> Optional[float]:
+        row = self._execute(
+            "SELECT created FROM cache WHERE namespace = ? AND key = ?",
+            json.dumps(key),
+        ).fetchone()
+        return None if row is None else float(row[0])
+
+    def set(self, key: Hashable, entry: Entry) -> None:
+        created, value, validators = entry
+        self.store.connection().execute(
+            "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                self.namespace,
+                json.dumps(key),
+                created,
+                time_ns(),
+                json.dumps(value),
+                None if validators is None else json.dumps(validators),
+            ),
+        )
+
+    def pop(self, key: Hashable) -> Optional[Entry]:
+        connection = self.store.connection()
+        encoded_key = json.dumps(key)
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._execute(
+                "SELECT created, value, validators FROM cache "
+                "WHERE namespace = ? AND key = ?",
+                encoded_key,
+            ).fetchone()
+            self._execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?", encoded_key
+            )
+        finally:
+            connection.execute("COMMIT")
+        return None if row is None else _decode_row(row)
+
+    def pop_lru(self, count: int) -> List[Hashable]:
+        if count <= 0:
+            return []
+        return self._delete_where("1 ORDER BY used LIMIT ?", count)
+
+    def pop_older(self, timestamp: float) -> List[Hashable]:
+        return self._delete_where("created < ?", timestamp)
+
+    def _delete_where(self, condition: str, *params: Any) -> List[Hashable]:
+        connection = self.store.connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = self._execute(
+                f"SELECT rowid, key FROM cache WHERE namespace = ? AND {condition}",
+                *params,
+            ).fetchall()
+            connection.executemany(
+                "DELETE FROM cache WHERE rowid = ?", [(row[0],) for row in rows]
+            )
+        finally:
+            connection.execute("COMMIT")
+        return [json.loads(row[1]) for row in rows]
+
+    def clear(self) -> None:
+        self._execute("DELETE FROM cache WHERE namespace = ?")
+
+    def items(self) -> List[Tuple[Hashable, Entry]]:
+        rows = self._execute(
+            "SELECT key, created, value, validators FROM cache "
+            "WHERE namespace = ? ORDER BY used"
+        ).fetchall()
+        return [(json.loads(row[0]), _decode_row(row[1:])) for row in rows]
+
+
+def _decode_row(row: Tuple[float, str, Optional[str]]) -> Entry:
+    created, value, validators = row
+    return (
+        created,
+        json.loads(value),
+        None if validators is None else json.loads(validators),
+    )
+
+
+def estimate_size(value: Any) -> int:
+    """
+    :return: the estimated memory footprint of a decoded JSON value in bytes,
+             including all nested containers and strings
+    """
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        item_size = sys.getsizeof(item, -1)
+        size += _approximate_size(item) if item_size < 0 else item_size
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return size
+
+
+def _approximate_size(item: Any) -> int:
+    # CPython like sizes for interpreters without sys.getsizeof (e.g. PyPy)
+    if isinstance(item, str):
+        return 49 + len(item)
+    if isinstance(item, dict):
+        return 64 + 24 * len(item)
+    if isinstance(item, (list, tuple)):
+        return 56 + 8 * len(item)
+    return 28
+
+
+class EvictionPolicy(ABC):
+    """
+    Decides which items a :class:`LruCache` evicts when it exceeds its limits.
+    Without a policy the least recently used items are evicted. The cache
+    serializes all calls of a policy.
+    """
+
+    @abstractmethod
+    def insert(self, key: Hashable) -> None:
+        """a new item was stored"""
+
+    @abstractmethod
+    def access(self, key: Hashable) -> None:
+        """an item was read from cache"""
+
+    @abstractmethod
+    def remove(self, key: Hashable) -> None:
+        """an item was removed, unknown keys are ignored"""
+
+    @abstractmethod
+    def victims(self, count: int) -> List[Hashable]:
+        """:return: up to ``count`` keys to be evicted, the policy forgets them"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """forget all keys"""
+
+
+class TwoQueuePolicy(EvictionPolicy):
+    """
+    The scan resistant 2Q eviction policy. New items enter a FIFO probation
+    queue and are moved to the protected LRU queue only when they are read
+    again. Items are evicted from probation first as long as it holds more
+    than ``in_ratio`` of all items, so a single pass over many resources
+    (e.g. the results of a search) cannot flush the frequently used ones.
+    Recently evicted probation keys are remembered and go straight to the
+    protected queue if they are stored again.
+    """
+
+    def __init__(self, in_ratio: float = 0.25, out_ratio: float = 0.5) -> None:
+        """
+        :param in_ratio: the share of items kept in probation before the
+                         protected items are evicted
+        :param out_ratio: the number of remembered evicted keys relative to
+                          the number of items
+        """
+        self.in_ratio = in_ratio
+        self.out_ratio = out_ratio
+        self._probation: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._protected: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._ghosts: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def insert(self, key: Hashable) -> None:
+        if key in self._ghosts:
+            del self._ghosts[key]
+            self._protected[key] = None
+        elif key not in self._protected:
+            self._probation[key] = None
+
+    def access(self, key: Hashable) -> None:
+        protected = self._protected
+        if key in protected:
+            protected.move_to_end(key)
+        elif self._probation.pop(key, False) is None:
+            protected[key] = None
+
+    def remove(self, key: Hashable) -> None:
+        self._probation.pop(key, None)
+        self._protected.pop(key, None)
+
+    def victims(self, count: int) -> List[Hashable]:
+        probation, protected, ghosts = self._probation, self._protected, self._ghosts
+        max_ghosts = int(self.out_ratio * (len(probation) + len(protected)))
+        keys: List[Hashable] = []
+        while len(keys) < count and (probation or protected):
+            in_limit = self.in_ratio * (len(probation) + len(protected))
+            if probation and (len(probation) > in_limit or not protected):
+                key, _ = probation.popitem(last=False)
+                ghosts[key] = None
+            else:
+                key, _ = protected.popitem(last=False)
+            keys.append(key)
+
+        while len(ghosts) > max_ghosts:
+            ghosts.popitem(last=False)
+        return keys
+
+    def clear(self) -> None:
+        self._probation.clear()
+        self._protected.clear()
+        self._ghosts.clear()
+
+
+#: the reasons why cached items are removed
+EVICTION_REASONS = ("size", "age", "explicit")
+
+
+@dataclass
+class CacheStats:
+    """
+    The usage counters of a :class:`LruCache`. Statistics of several caches
+    can be added up::
+
+        total = sum(client.cache_stats().values(), CacheStats())
+    """
+
+    #: lookups that returned a cached value
+    hits: int = 0
+    #: lookups of items that were missing or expired
+    misses: int = 0
+    #: values that were requested again although they were cached
+    refreshes: int = 0
+    #: number of removed items by reason: ``size`` (``max_size`` or ``max_bytes``
+    #: exceeded), ``age`` (expired) and ``explicit`` (deleted or cleared)
+    evictions: Dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(EVICTION_REASONS, 0)
+    )
+    #: the number of cached items
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """the share of lookups that were hits, ``0.0`` without any lookups"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __add__(self, other: "CacheStats") -> "CacheStats":
+        evictions = dict(self.evictions)
+        for reason, count in other.evictions.items():
+            evictions[reason] = evictions.get(reason, 0) + count
+        return CacheStats(
+            hits=self.hits + other.hits,
+            misses=self.misses + other.misses,
+            refreshes=self.refreshes + other.refreshes,
+            evictions=evictions,
+            size=self.size + other.size,
+        )
+
+
+# pylint: disable=too-many-instance-attributes,too-many-public-methods
 class LruCache(Generic[_T]):
-    def __init__(self, max_size: int = -1) -> None:
-        self._cache: "OrderedDict[Hashable, Tuple[float, _T]]" = OrderedDict()
+    """
+    A least recently used cache. All operations are atomic, so the cache can be
+    shared between threads. Iterating methods return snapshots.
+    """
+
+    def __init__(
+        self,
+        max_size: int = -1,
+        backend: Optional[CacheBackend] = None,
+        max_age_s: Optional[float] = None,
+        *,
+        max_bytes: Optional[int] = None,
+        size_estimator: Callable[[Any], int] = estimate_size,
+        policy: Optional[EvictionPolicy] = None,
+    ) -> None:
+        """
+        :param max_size: the maximum number of items, ``-1`` is unbounded
+        :param backend: stores the items, by default they are kept in memory
+        :param max_age_s: items older than this are treated as missing,
+                          ``None`` disables the expiry
+        :param max_bytes: the maximum estimated size of all values in bytes,
+                          ``None`` is unbounded
+        :param size_estimator: estimates the size of a value in bytes
+        :param policy: selects the evicted items, by default the least recently
+                       used ones (e.g. :class:`TwoQueuePolicy`)
+        """
+        #: stores the cached items
+        self.backend: CacheBackend = MemoryBackend() if backend is None else backend
+        #: items older than this are treated as missing when they are read,
+        #: ``None`` disables the expiry
+        self.max_age_s: Optional[float] = max_age_s
+        #: estimates the size of a value in bytes
+        self.size_estimator: Callable[[Any], int] = size_estimator
         self._max_size = max_size
+        self._max_bytes: Optional[int] = None
+        self._sizes: Dict[Hashable, int] = {}
+        self._nbytes = 0
+        self._stats = CacheStats()
+        self._policy: Optional[EvictionPolicy] = None
+        self._lock = RLock()
+        self.max_bytes = max_bytes
+        self.policy = policy
 
     @property
     def max_size(self) -> int:
@@ -19,85 +574,364 @@ class LruCache(Generic[_T]):
 
     @max_size.setter
     def max_size(self, value: int):
-        self._max_size = max(value, -1)
-        self.evict()
+        with self._lock:
+            self._max_size = max(value, -1)
+            self.evict()
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """the maximum estimated size of all values in bytes, ``None`` is unbounded"""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: Optional[int]):
+        with self._lock:
+            self._max_bytes = value
+            sizes = self._sizes
+            sizes.clear()
+            if value is not None:
+                estimator = self.size_estimator
+                for key, entry in self.backend.items():
+                    sizes[key] = estimator(entry[1])
+            self._nbytes = sum(sizes.values())
+            self.evict()
+
+    @property
+    def policy(self) -> Optional[EvictionPolicy]:
+        """selects the evicted items, ``None`` evicts the least recently used ones"""
+        return self._policy
+
+    @policy.setter
+    def policy(self, value: Optional[EvictionPolicy]):
+        with self._lock:
+            if value is not None:
+                value.clear()
+                for key, _ in self.backend.items():
+                    value.insert(key)
+            self._policy = value
+            self.evict()
+
+    @property
+    def nbytes(self) -> int:
+        """the estimated size of all cached values in bytes"""
+        with self._lock:
+            if self._max_bytes is not None:
+                return self._nbytes
+            estimator = self.size_estimator
+            return sum(estimator(entry[1]) for _, entry in self.backend.items())
+
+    @property
+    def stats(self) -> CacheStats:
+        """a snapshot of the usage counters, see :meth:`reset_stats`"""
+        with self._lock:
+            stats = self._stats
+            return CacheStats(
+                hits=stats.hits,
+                misses=stats.misses,
+                refreshes=stats.refreshes,
+                evictions=dict(stats.evictions),
+                size=len(self.backend),
+            )
+
+    def reset_stats(self) -> None:
+        """set all usage counters to zero"""
+        with self._lock:
+            self._stats = CacheStats()
+
+    def count_refresh(self) -> None:
+        """count a value that is requested again although it may be cached"""
+        with self._lock:
+            self._stats.refreshes += 1
+
+    def _count_lookup(self, entry: Optional[Entry]) -> Optional[Entry]:
+        stats = self._stats
+        if entry is None:
+            stats.misses += 1
+        else:
+            stats.hits += 1
+        return entry
+
+    def _forget(self, keys: Iterable[Hashable]) -> None:
+        sizes = self._sizes
+        for key in keys:
+            self._nbytes -= sizes.pop(key, 0)
+
+    def _evicted(self, reason: str, keys: List[Hashable]) -> None:
+        self._forget(keys)
+        self._stats.evictions[reason] += len(keys)
+        policy = self._policy
+        if policy is not None:
+            for key in keys:
+                policy.remove(key)
+
+    def _accessed(self, item: Hashable, entry: Optional[Entry]) -> Optional[Entry]:
+        policy = self._policy
+        if policy is not None and entry is not None:
+            policy.access(item)
+        return entry
+
+    def _pop_lru(self, count: int) -> List[Hashable]:
+        backend = self.backend
+        policy = self._policy
+        if policy is None or count < 1:
+            return backend.pop_lru(count)
+
+        keys = [key for key in policy.victims(count) if backend.pop(key) is not None]
+        if len(keys) < count:
+            # items unknown to the policy, e.g. stored by another process
+            keys.extend(backend.pop_lru(count - len(keys)))
+        return keys
 
     def evict(self, max_age_s: Union[None, int, float] = None) -> None:
-        cache = self._cache
-        if max_age_s is not None:
-            min_timestamp = monotonic() - max_age_s
-            outdated = [key for key, value in cache.items() if value[0] < min_timestamp]
-            for key in outdated:
-                del cache[key]
+        with self._lock:
+            backend = self.backend
+            if max_age_s is not None:
+                self._evicted("age", backend.pop_older(backend.clock() - max_age_s))
 
-        max_size = self._max_size
-        if max_size < 0:
-            return
+            max_size = self._max_size
+            if max_size == 0:
+                self._stats.evictions["size"] += len(backend)
+                self._clear()
+                return
 
-        if max_size == 0:
-            cache.clear()
+            if max_size > 0:
+                self._evicted("size", self._pop_lru(len(backend) - max_size))
+            self._shrink()
+
+    def _shrink(self) -> None:
+        max_bytes = self._max_bytes
+        if max_bytes is None:
             return
+        backend = self.backend
+        while self._nbytes > max_bytes and len(backend):
+            self._evicted("size", self._pop_lru(1))
 
-        for _ in range(len(cache) - max_size):
-            cache.popitem(last=False)
+    def _fresh(self, item: Hashable, entry: Optional[Entry]) -> Optional[Entry]:
+        # expired entries are dropped, unless they can be revalidated
+        max_age_s = self.max_age_s
+        if entry is None or max_age_s is None:
+            return entry
+        if self.backend.clock() - entry[0] <= max_age_s:
+            return entry
+        if entry[2] is None:
+            self.backend.pop(item)
+            self._evicted("age", [item])
+        return None
 
     def setdefault(self, item, default: _T) -> _T:
         max_size = self._max_size
         if max_size == 0:
             return default
 
-        cache = self._cache
-        if item in cache:
-            cache.move_to_end(item)
-            return cache[item][1]
-
-        if 0 < max_size <= len(cache):
-            cache.popitem(last=False)
+        with self._lock:
+            entry = self._count_lookup(self._fresh(item, self.backend.get(item)))
+            self._accessed(item, entry)
+            if entry is not None:
+                value: _T = entry[1]
+                return value
 
-        cache[item] = monotonic(), default
-        return default
+            self._store(item, (self.backend.clock(), default, None))
+            return default
 
     def clear(self) -> None:
-        self._cache.clear()
+        with self._lock:
+            self._stats.evictions["explicit"] += len(self.backend)
+            self._clear()
+
+    def _clear(self) -> None:
+        self.backend.clear()
+        if self._policy is not None:
+            self._policy.clear()
+        self._sizes.clear()
+        self._nbytes = 0
 
     def keys(self):
-        return self._cache.keys()
+        with self._lock:
+            return dict.fromkeys(key for key, _ in self.backend.items()).keys()
 
     def values(self):
-        return (value for _, value in self._cache.values())
+        with self._lock:
+            return [entry[1] for _, entry in self.backend.items()]
 
     def items(self):
-        return ((key, value) for key, (_, value) in self._cache.items())
+        with self._lock:
+            return [(key, entry[1]) for key, entry in self.backend.items()]
 
     def __len__(self):
-        return len(self._cache)
+        with self._lock:
+            return len(self.backend)
 
     def __contains__(self, item: Hashable):
-        return item in self._cache
+        with self._lock:
+            if self.max_age_s is None:
+                return item in self.backend
+            return self._fresh(item, self.backend.get(item, touch=False)) is not None
 
     def __getitem__(self, item: Hashable) -> _T:
-        cache = self._cache
-        cache.move_to_end(item)
-        return cache[item][1]
+        with self._lock:
+            entry = self._count_lookup(self._fresh(item, self.backend.get(item)))
+            self._accessed(item, entry)
+        if entry is None:
+            raise KeyError(item)
+        value: _T = entry[1]
+        return value
+
+    def get(
+        self, item: Hashable, default: Optional[_T] = None, *, stale=False
+    ) -> Optional[_T]:
+        """
+        :param item: the item key
+        :param default: returned if the item is not cached
+        :param stale: also return expired items that are kept for revalidation,
+                      such lookups are not counted in :attr:`stats`
+        :return: the value of the item or ``default`` if it is not cached,
+                 unlike checking ``item in cache`` before ``cache[item]``
+                 this cannot fail if another thread evicts the item
+        """
+        with self._lock:
+            entry = self.backend.get(item)
+            if not stale:
+                entry = self._count_lookup(self._fresh(item, entry))
+            self._accessed(item, entry)
+        if entry is None:
+            return default
+        value: _T = entry[1]
+        return value
+
+    def peek(self, item: Hashable, default: Optional[_T] = None) -> Optional[_T]:
+        """
+        :return: the value of the item or ``default`` if it is not cached or expired,
+                 unlike :meth:`get` the lookup is not counted in :attr:`stats`
+                 and the order of the items is not changed
+        """
+        with self._lock:
+            entry = self._fresh(item, self.backend.get(item, touch=False))
+        if entry is None:
+            return default
+        value: _T = entry[1]
+        return value
+
+    def written_at(self, item: Hashable) -> Optional[float]:
+        """
+        :return: the time of the last write of the item (see :attr:`CacheBackend.clock`)
+                 or ``None`` if it is not cached or expired, the value is not read
+                 and the lookup is not counted in :attr:`stats`
+        """
+        with self._lock:
+            backend = self.backend
+            written_at = backend.written_at(item)
+            max_age_s = self.max_age_s
+            if written_at is None or max_age_s is None:
+                return written_at
+            if backend.clock() - written_at <= max_age_s:
+                return written_at
+        return None
 
     def __setitem__(self, item: Hashable, value: _T) -> None:
-        max_size = self._max_size
-        if max_size == 0:
+        self.set(item, value)
+
+    def set(
+        self, item: Hashable, value: _T, validators: Optional[Validators] = None
+    ) -> None:
+        """
+        Set the value of an item.
+
+        :param item: the item key
+        :param value: the item value
+        :param validators: the conditional request headers that revalidate the value
+                           (e.g. ``{"If-None-Match": etag}``)
+        """
+        if self._max_size == 0:
             return
 
-        cache = self._cache
-        if item in cache:
-            cache.move_to_end(item)
-        elif 0 < max_size <= len(cache):
-            cache.popitem(last=False)
+        with self._lock:
+            self._store(item, (self.backend.clock(), value, validators))
+
+    def _store(self, item: Hashable, entry: Entry) -> None:
+        backend = self.backend
+        max_bytes = self._max_bytes
+        size = 0
+        if max_bytes is not None:
+            size = self.size_estimator(entry[1])
+            if size > max_bytes:
+                # too large to be cached at all
+                if backend.pop(item) is not None:
+                    self._evicted("size", [item])
+                return
+
+        max_size = self._max_size
+        policy = self._policy
+        is_new = (max_size > 0 or policy is not None) and item not in backend
+        if max_size > 0 and is_new:
+            self._evicted("size", self._pop_lru(len(backend) - max_size + 1))
+        backend.set(item, entry)
+        if policy is not None and is_new:
+            policy.insert(item)
+
+        if max_bytes is not None:
+            self._forget((item,))
+            self._sizes[item] = size
+            self._nbytes += size
+            self._shrink()
 
-        cache[item] = monotonic(), value
+    def validators(self, item: Hashable) -> Optional[Validators]:
+        """:return: the conditional request headers stored with the item"""
+        with self._lock:
+            entry = self.backend.get(item, touch=False)
+        return None if entry is None else entry[2]
 
     def __delitem__(self, item: Hashable) -> None:
-        del self._cache[item]
+        with self._lock:
+            entry = self.backend.pop(item)
+            if entry is not None:
+                self._evicted("explicit", [item])
+        if entry is None:
+            raise KeyError(item)
+
+    def pop(self, item: Hashable, default: Optional[_T] = None) -> Optional[_T]:
+        """remove the item and :return: its value or ``default`` if it is not cached"""
+        with self._lock:
+            entry = self.backend.pop(item)
+            if entry is not None:
+                self._evicted("explicit", [item])
+        if entry is None:
+            return default
+        value: _T = entry[1]
+        return value
 
     def age_s(self, item: Hashable) -> Optional[float]:
-        try:
-            return monotonic() - self._cache[item][0]
-        except KeyError:
-            return None
+        with self._lock:
+            backend = self.backend
+            entry = backend.get(item, touch=False)
+            return None if entry is None else backend.clock() - entry[0]
+
+    def entries(self) -> List[Tuple[Hashable, float, _T, Optional[Validators]]]:
+        """
+        :return: a snapshot of all items as ``(key, age_s, value, validators)``
+                 from the least to the most recently used one
+        """
+        with self._lock:
+            backend = self.backend
+            now = backend.clock()
+            return [
+                (key, now - entry[0], entry[1], entry[2])
+                for key, entry in backend.items()
+            ]
+
+    def restore(
+        self,
+        item: Hashable,
+        value: _T,
+        age_s: float = 0.0,
+        validators: Optional[Validators] = None,
+    ) -> None:
+        """
+        Set the value of an item that was cached ``age_s`` seconds ago,
+        e.g. when loading a snapshot (see :meth:`set`).
+        """
+        if self._max_size == 0:
+            return
+
+        with self._lock:
+            clock = self.backend.clock
+            self._store(item, (clock() - age_s, value, validators))
@@ -1,40 +1,64 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 
+import gzip
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from contextvars import ContextVar
+from copy import deepcopy
 from dataclasses import dataclass
 from functools import cached_property
+from inspect import signature
 from textwrap import shorten
+from time import perf_counter, sleep, time
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
     Literal,
     Optional,
     Sequence,
     Tuple,
+    Type,
     TypeVar,
     Union,
     overload,
 )
 
 import requests
-from requests import HTTPError, JSONDecodeError, Response
+from requests import HTTPError, Response
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
 
 from .articles import Articles
+from .cache import LruCache
+from .codec import JsonCodec, get_codec
 from .groups import Groups
 from .notifications import Notifications
 from .organizations import Organizations
+from .ratelimit import RateLimiter
+from .resources import IterableT, ResourcesT
 from .roles import Roles
+from .snapshot import SnapshotEntry, read_snapshot, write_snapshot
 from .tags import Tags
 from .tickets import Priorities, States, Tickets
 from .time_accountings import TimeAccountings
 from .users import Users
+from .utils import SingleFlight, iter_json_array
 
 if TYPE_CHECKING:
+    import os
+
+    from .cache import CacheBackend, CacheStats, Validators
     from .utils import JsonType, StringKeyMapping
 
 LOG = logging.getLogger(__name__)
+HOOK_EVENTS = ("before_request", "after_response", "on_error", "cache_lookup")
 
 
 class APIException(HTTPError):
@@ -57,18 +81,80 @@ class Pagination:
     expand: bool = False
 
 
-def raise_or_return_json(response: requests.Response) -> "JsonType":
+# pylint: disable=too-many-instance-attributes
+@dataclass
+class Transport:
+    """connection pooling and retry settings of the clients HTTP session"""
+
+    pool_connections: int = 10  #: number of cached connection pools (one per host)
+    pool_maxsize: int = 10  #: maximum number of connections kept per host
+    #: if ``True`` wait for a free connection instead of opening an additional one
+    pool_block: bool = False
+    keep_alive: bool = True  #: reuse connections for subsequent requests
+    #: maximum number of retries on connection errors and ``retry_status`` responses
+    retries: int = 3
+    #: the delay between retries is ``backoff_factor * 2 ** (retry number - 1)`` seconds
+    backoff_factor: float = 0.5
+    #: maximum delay between retries in seconds (requires urllib3 2.x)
+    backoff_max: float = 60.0
+    #: adds a random delay up to the given seconds (requires urllib3 2.x)
+    backoff_jitter: float = 0.0
+    #: response status codes that cause a retry, ``Retry-After`` headers are honoured
+    retry_status: Tuple[int, ...] = (429, 502, 503, 504)
+    #: if ``True`` also the non-idempotent ``POST`` requests are retried
+    retry_post: bool = False
+
+    def retry(self) -> Retry:
+        """:return: the retry policy used by the HTTP adapter"""
+        allowed_methods = Retry.DEFAULT_ALLOWED_METHODS
+        if self.retry_post:
+            allowed_methods = allowed_methods | {"POST"}
+
+        options: Dict[str, Any] = {}
+        if "backoff_jitter" in signature(Retry).parameters:
+            options["backoff_max"] = self.backoff_max
+            options["backoff_jitter"] = self.backoff_jitter
+
+        return Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.retry_status,
+            allowed_methods=allowed_methods,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            **options,
+        )
+
+    def adapter(self) -> HTTPAdapter:
+        """:return: a new HTTP adapter with the pool and retry settings"""
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.retry(),
+            pool_block=self.pool_block,
+        )
+
+
+def raise_or_return_json(
+    response: requests.Response, codec: Optional[JsonCodec] = None
+) -> "JsonType":
+    if codec is None:
+        codec = get_codec("json")
+    loads = codec.loads
+    decode_error: Tuple[Type[Exception], ...] = codec.decode_error
+    info_error: Tuple[Type[Exception], ...] = (*decode_error, AttributeError, KeyError)
+
     try:
         response.raise_for_status()
     except HTTPError as exc:
         try:
-            info = response.json()
+            info = loads(response.content)
             exception: HTTPError = APIException(
                 info.get("error_human") or info["error"],
                 request=exc.request,
                 response=exc.response,
             )
-        except (JSONDecodeError, KeyError):
+        except info_error:
             message = response.text
             LOG.error(
                 "HTTP:%d (%s): %s", response.status_code, response.reason, message
@@ -77,12 +163,13 @@ def raise_or_return_json(response: requests.Response) -> "JsonType":
         raise exception from exc
 
     try:
-        json_response: "JsonType" = response.json()
+        json_response: "JsonType" = loads(response.content)
         return json_response
-    except JSONDecodeError:
+    except decode_error:  # pylint: disable=catching-non-exception
         return response.text
 
 
+# pylint: disable=too-many-public-methods
 class Client:
     """
     The root class to interact with the *REST API*.
@@ -100,6 +187,10 @@ class Client:
         # authenticate with bearer token (OAuth 2.0)
         client = Client("https://myhost.com/api/v1/", oauth2_token="<secret_token>")
 
+    A client instance can be shared between threads: requests, the resource caches
+    and the rate limiters are thread-safe and :meth:`impersonation_of` only affects
+    the calling thread (or asyncio task). Resource objects hold no mutable state besides their
+    cached info, so sharing them is safe as well.
     """
 
     _T = TypeVar("_T")
@@ -159,6 +250,7 @@ class Client:
         """Manages the ``/users`` endpoint."""
         return Users(self)
 
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         url: str,
@@ -167,6 +259,11 @@ class Client:
         http_token: Optional[str] = None,
         oauth2_token: Optional[str] = None,
         additional_headers: Sequence[Tuple[str, str]] = (),
+        transport: Optional[Transport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        compress_requests: Optional[int] = None,
+        codec: Union[None, str, JsonCodec] = None,
+        cache_backend: Optional[Callable[[str], "CacheBackend"]] = None,
     ) -> None:
         """
         For authentication use either ``http_auth`` or ``http_token`` or ``oauth2_token``.
@@ -177,6 +274,16 @@ class Client:
         :param oauth2_token: access token when using OAuth 2 Authentication
         :param additional_headers: additional name, value pairs that will be
                 appended to the requests header ``[(name, value), ...]``
+        :param transport: connection pooling and retry settings
+        :param rate_limiter: limits the rate of all requests
+        :param compress_requests: JSON request bodies of at least this size in bytes
+                are sent gzip compressed (the server has to support it),
+                ``None`` disables request compression
+        :param codec: the JSON codec or the name of the JSON library
+                (e.g. ``"orjson"``), by default the fastest installed library is used
+        :param cache_backend: creates the storage of a resource cache by the
+                resource URL (e.g. :class:`cache.SqliteStore`), by default the
+                resources are cached in memory
         :raises: :exc:`ValueError` if authentication settings are missing.
 
 
@@ -187,6 +294,14 @@ class Client:
             requests.Session()
         )  #: the requests Session instance
         self.session.headers["User-Agent"] = "zammadoo Python client"
+        # all response encodings supported by urllib3 (e.g. brotli or zstd if installed)
+        self.session.headers.update(make_headers(accept_encoding=True))
+        #: minimum size of JSON request bodies to be compressed, ``None`` disables it
+        self.compress_requests: Optional[int] = compress_requests
+        #: encodes request and decodes response bodies
+        self.codec: JsonCodec = get_codec(codec)
+        #: creates the storage of the resource caches
+        self.cache_backend: Optional[Callable[[str], "CacheBackend"]] = cache_backend
         if http_token:
             self.session.headers["Authorization"] = f"Token token={http_token}"
         elif oauth2_token:
@@ -196,8 +311,29 @@ class Client:
         else:
             raise TypeError(f"{self.__class__} needs an authentication parameter.")
 
+        self.transport: Transport = transport or Transport()  #: the transport settings
+        adapter = self.transport.adapter()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not self.transport.keep_alive:
+            self.session.headers["Connection"] = "close"
+
         self.session.headers.update(additional_headers)
 
+        #: registered callbacks by event name, see :meth:`add_hook`
+        self.hooks: Dict[str, List[Callable[..., Any]]] = {
+            event: [] for event in HOOK_EVENTS
+        }
+
+        #: limits the rate of all requests
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        #: additional rate limits by endpoint prefix, e.g. ``{"tickets/search": limiter}``
+        self.rate_limiters: Dict[str, RateLimiter] = {}
+        self._single_flight = SingleFlight()
+        self._on_behalf_of: ContextVar[Optional[str]] = ContextVar(
+            "on_behalf_of", default=None
+        )
+
     def __del__(self):
         self.session.close()
 
@@ -215,18 +351,38 @@ class Client:
                 print(client.users.me().id)  # output: 1
 
 
+        The impersonation only applies to requests of the current thread
+        or asyncio task.
+
         :param user: user id or login_name
         """
-        headers = self.session.headers
-        restore_value = headers.pop("X-On-Behalf-Of", None)
+        token = self._on_behalf_of.set(str(user))
         try:
-            headers["X-On-Behalf-Of"] = str(user)
             yield
         finally:
-            if restore_value is None:
-                self.session.headers.pop("X-On-Behalf-Of", None)
-            else:
-                headers["X-On-Behalf-Of"] = restore_value
+            self._on_behalf_of.reset(token)
+
+    @property
+    def on_behalf_of(self) -> Optional[str]:
+        """the impersonated user of the current context, see :meth:`impersonation_of`"""
+        return self._on_behalf_of.get()
+
+    def propagate_context(self, func: Callable[..., _T]) -> Callable[..., _T]:
+        """
+        :meta private:
+
+        :return: a wrapper that calls ``func`` in another thread with the
+                 impersonation of the current thread
+        """
+        on_behalf_of = self.on_behalf_of
+        if on_behalf_of is None:
+            return func
+
+        def _wrapper(*args, **kwargs) -> Client._T:
+            with self.impersonation_of(on_behalf_of):
+                return func(*args, **kwargs)
+
+        return _wrapper
 
     def request(
         self,
@@ -252,10 +408,34 @@ class Client:
         url = "/".join(filter(bool, map(str, args)))
         if not url.startswith(self.url):
             url = f"{self.url}/{url}" if url else self.url
-        response = self.response(method, url, json=json, params=params, **kwargs)
-        value = raise_or_return_json(response)
-        LOG.debug("HTTP:%s returned %s", method, shorten(repr(value), width=120))
-        return value
+
+        def _request() -> "JsonType":
+            response = self.response(method, url, json=json, params=params, **kwargs)
+            value = self._json(method, url, response)
+            LOG.debug("HTTP:%s returned %s", method, shorten(repr(value), width=120))
+            return value
+
+        if method == "GET" and json is None and not kwargs:
+            # concurrent identical reads share a single request,
+            # but every caller gets its own response object
+            param_key = repr(sorted(params.items())) if params else None
+            return self.coalesce((method, url, param_key), _request, copy=deepcopy)
+        return _request()
+
+    def coalesce(
+        self,
+        key: Hashable,
+        func: Callable[[], _T],
+        copy: Optional[Callable[[_T], _T]] = None,
+    ) -> _T:
+        """
+        :meta private:
+
+        Call ``func`` unless a call with the same key for the same impersonated
+        user is in flight in another thread, then wait for that result instead
+        (see :class:`utils.SingleFlight`).
+        """
+        return self._single_flight((key, self.on_behalf_of), func, copy)
 
     def response(
         self,
@@ -276,17 +456,32 @@ class Client:
         :rtype: :class:`requests.Response`
         """
 
+        self._throttle(url)
         loglevel = LOG.getEffectiveLevel()
-        response = self.session.request(
-            method,
-            url,
-            params=(
-                (key, str(value).lower() if isinstance(value, bool) else value)
-                for key, value in (params.items() if params else ())
-            ),
-            json=json,
-            **kwargs,
-        )
+        on_behalf_of = self.on_behalf_of
+        if on_behalf_of is not None:
+            kwargs["headers"] = {
+                "X-On-Behalf-Of": on_behalf_of,
+                **(kwargs.get("headers") or {}),
+            }
+        if json is not None:
+            kwargs["data"], kwargs["headers"] = self._encode_body(
+                json, kwargs.get("headers")
+            )
+        kwargs["params"] = [
+            (key, str(value).lower() if isinstance(value, bool) else value)
+            for key, value in (params.items() if params else ())
+        ]
+        self.call_hooks("before_request", method, url, kwargs)
+
+        start = perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException as exc:
+            self.call_hooks("on_error", method, url, exc)
+            raise
+        self.call_hooks("after_response", method, url, response, perf_counter() - start)
+
         if kwargs.get("stream") and loglevel == logging.DEBUG:
             headers = response.headers
             mapping = dict.fromkeys(("Content-Length", "Content-Type"))
@@ -300,8 +495,115 @@ class Client:
             LOG.debug("HTTP:%s %s json=%r", method, response.url, json)
         else:
             LOG.info("HTTP:%s %s", method, response.url)
+
+        if not kwargs.get("stream") and loglevel == logging.DEBUG:
+            self._log_transfer_size(response)
         return response
 
+    def _json(self, method: str, url: str, response: Response) -> "JsonType":
+        try:
+            return raise_or_return_json(response, self.codec)
+        except HTTPError as exc:
+            self.call_hooks("on_error", method, url, exc)
+            raise
+
+    def add_hook(self, event: str, callback: Callable[..., Any]) -> None:
+        """
+        Register a callback for a client event.
+
+        * ``"before_request"``: ``callback(method, url, kwargs)`` before a request is sent,
+          ``kwargs`` are the parameters passed to :meth:`requests.Session.request`
+          and can be modified
+        * ``"after_response"``: ``callback(method, url, response, elapsed_s)``
+          for every response
+        * ``"on_error"``: ``callback(method, url, exception)`` if a request failed
+          or the server responded with an error
+        * ``"cache_lookup"``: ``callback(url, hit)`` if a resource is looked up in cache
+
+        ::
+
+            def log_slow_requests(method, url, response, elapsed_s):
+                if elapsed_s > 1.0:
+                    print(f"{method} {url} took {elapsed_s:.1f}s")
+
+            client.add_hook("after_response", log_slow_requests)
+
+        :param event: the event name
+        :param callback: the function to be called
+        :raises: :exc:`KeyError` if the event is unknown
+        """
+        self.hooks[event].append(callback)
+
+    def remove_hook(self, event: str, callback: Callable[..., Any]) -> None:
+        """
+        Remove a registered callback.
+
+        :raises: :exc:`ValueError` if the callback was not registered
+        """
+        self.hooks[event].remove(callback)
+
+    def call_hooks(self, event: str, *args) -> None:
+        """:meta private:"""
+        for callback in tuple(self.hooks[event]):
+            callback(*args)
+
+    def _encode_body(
+        self, json: "StringKeyMapping", headers: Optional["StringKeyMapping"]
+    ) -> Tuple[bytes, Dict[str, str]]:
+        body = self.codec.dumps(json)
+        new_headers = {"Content-Type": "application/json", **(headers or {})}
+        threshold = self.compress_requests
+        if threshold is None or len(body) < threshold:
+            return body, new_headers
+
+        compressed_body = gzip.compress(body)
+        LOG.debug(
+            "HTTP: compressed request body from %d to %d bytes (%.1f%% saved)",
+            len(body),
+            len(compressed_body),
+            100.0 * (1.0 - len(compressed_body) / len(body)),
+        )
+        new_headers["Content-Encoding"] = "gzip"
+        return compressed_body, new_headers
+
+    @staticmethod
+    def _log_transfer_size(response: Response) -> None:
+        headers = response.headers
+        encoding = headers.get("Content-Encoding", "identity")
+        if encoding == "identity":
+            return
+
+        size = len(response.content)
+        transferred = int(headers.get("Content-Length") or response.raw.tell())
+        LOG.debug(
+            "HTTP: received %d bytes %s encoded, %d bytes decoded (%.1f%% saved)",
+            transferred,
+            encoding,
+            size,
+            100.0 * (1.0 - transferred / size) if size else 0.0,
+        )
+
+    def _throttle(self, url: str) -> None:
+        limiters = []
+        if self.rate_limiter is not None:
+            limiters.append(self.rate_limiter)
+
+        endpoint_limiters = self.rate_limiters
+        if endpoint_limiters:
+            endpoint = url[len(self.url) + 1 :] if url.startswith(self.url) else url
+            prefixes = [
+                prefix
+                for prefix in endpoint_limiters
+                if endpoint == prefix or endpoint.startswith(f"{prefix}/")
+            ]
+            if prefixes:
+                limiters.append(endpoint_limiters[max(prefixes, key=len)])
+
+        delay = max((limiter.reserve() for limiter in limiters), default=0.0)
+        if delay > 0.0:
+            LOG.debug("HTTP: rate limit reached, waiting %.3fs", delay)
+            sleep(delay)
+
     @overload
     def get(
         self,
@@ -322,6 +624,81 @@ class Client:
     def get(self, *args, params=None, _erase_return_type=False):
         return self.request("GET", *args, params=params)
 
+    def stream(
+        self,
+        *args,
+        params: Optional["StringKeyMapping"] = None,
+        key: Optional[str] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[Any]:
+        """
+        Perform a ``GET`` request and decode the items of the returned JSON array
+        one by one while the response is received, so large responses do not have
+        to be kept in memory completely.
+
+        ::
+
+            for entry in client.stream("ticket_history", 123, key="history"):
+                print(entry["type"])
+
+        :param args: endpoint specifiers
+        :param params: URL parameter
+        :param key: decode the array of this key of a JSON object response
+                    instead of a JSON array response
+        :param chunk_size: number of bytes read at once
+        :raises: :exc:`APIException`, :class:`requests.HTTPError`,
+                 :exc:`ValueError` if the response has not the expected structure
+        """
+        url = "/".join(filter(bool, map(str, args)))
+        if not url.startswith(self.url):
+            url = f"{self.url}/{url}" if url else self.url
+
+        response = self.response("GET", url, params=params, stream=True)
+        try:
+            if not response.ok:
+                self._json("GET", url, response)
+            yield from iter_json_array(
+                response.iter_content(chunk_size), self.codec.loads, key
+            )
+        finally:
+            response.close()
+
+    def get_if_modified(
+        self,
+        url: str,
+        *,
+        params: Optional["StringKeyMapping"] = None,
+        validators: Optional["Validators"] = None,
+    ) -> Tuple["JsonType", Optional["Validators"]]:
+        """
+        Perform a conditional ``GET`` request.
+
+        :param url: full resource URL
+        :param params: URL parameter
+        :param validators: conditional request headers from a previous response
+        :return: the server JSON response or ``None`` if the resource was not modified
+                 and the validators for the next request
+        :raises: :exc:`APIException`, :class:`requests.HTTPError`
+        """
+        response = self.response("GET", url, params=params, headers=validators)
+        if validators and response.status_code == 304:
+            LOG.debug("HTTP:GET returned 304 (%s)", response.reason)
+            return None, validators
+
+        value = self._json("GET", url, response)
+        LOG.debug("HTTP:GET returned %s", shorten(repr(value), width=120))
+
+        headers = response.headers
+        new_validators = {
+            name: headers[key]
+            for key, name in (
+                ("ETag", "If-None-Match"),
+                ("Last-Modified", "If-Modified-Since"),
+            )
+            if key in headers
+        }
+        return value, new_validators or None
+
     def post(self, *args, json: Optional["StringKeyMapping"] = None):
         """shortcut for :meth:`request` with parameter ``("POST", *args, json)``"""
         return self.request("POST", *args, json=json)
@@ -334,6 +711,200 @@ class Client:
         """shortcut for :meth:`request` with parameter ``("DELETE", *args, json)``"""
         return self.request("DELETE", *args, json=json)
 
+    def _resource_managers(self) -> Iterator[Tuple[str, ResourcesT[Any]]]:
+        # the instantiated resource managers including nested ones by attribute path
+        managers = [("", vars(self))]
+        while managers:
+            prefix, attributes = managers.pop()
+            for name, value in attributes.items():
+                if isinstance(value, ResourcesT):
+                    path = f"{prefix}{name}"
+                    yield path, value
+                    managers.append((f"{path}.", getattr(value, "__dict__", {})))
+
+    def _snapshot_sections(self) -> Iterator[Tuple[str, List[SnapshotEntry]]]:
+        now = time()
+        for path, manager in self._resource_managers():
+            if len(manager.cache):
+                yield f"{path}.cache", [
+                    (key, now - age_s, value, validators)
+                    for key, age_s, value, validators in manager.cache.entries()
+                ]
+
+        tags: Optional[Tags] = vars(self).get("tags")
+        if tags is not None:
+            yield "tags.ticket_cache", [
+                (key, now - age_s, value, validators)
+                for key, age_s, value, validators in tags.ticket_cache.entries()
+            ]
+            loaded_at = tags.loaded_at
+            if loaded_at is not None:
+                yield "tags.cache", [
+                    (name, loaded_at, dict(info), None)
+                    for name, info in tags.cache.items()
+                ]
+
+    def _snapshot_target(self, path: str) -> Any:
+        # resolves a section path, only resource manager properties are followed
+        owner: Any = self
+        *names, attribute = path.split(".")
+        for name in names:
+            prop = getattr(type(owner), name, None)
+            if not isinstance(prop, cached_property):
+                return None
+            manager_type = prop.func.__annotations__.get("return")
+            if not (
+                isinstance(manager_type, type)
+                and issubclass(manager_type, (ResourcesT, Tags))
+            ):
+                return None
+            owner = getattr(owner, name)
+        if attribute not in {"cache", "ticket_cache"}:
+            return None
+        return getattr(owner, attribute, None)
+
+    def dump_cache(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """
+        Write the resource caches and the tag caches to a binary snapshot file.
+        The file can be loaded by other clients of the same server with
+        :meth:`load_cache` to start with warm caches::
+
+            client.preload()
+            client.dump_cache("zammad-cache.bin")
+
+        The file is replaced atomically, so clients can load an older
+        snapshot while a new one is written.
+
+        :param path: the snapshot file
+        """
+        write_snapshot(path, self.url, self._snapshot_sections(), self.codec.dumps)
+
+    def load_cache(
+        self, path: Union[str, "os.PathLike[str]"], max_age_s: Optional[float] = None
+    ) -> Dict[str, int]:
+        """
+        Fill the caches from a snapshot written by :meth:`dump_cache`. The file
+        is memory mapped and only the entries that are loaded are decoded.
+        Cached objects keep their age and are loaded from the oldest to the
+        newest, the resource cache limits (size, age and memory) still apply::
+
+            client = Client(url, http_token=token)
+            client.load_cache("zammad-cache.bin", max_age_s=3600)
+
+        :param path: the snapshot file
+        :param max_age_s: skip objects older than this
+        :return: the number of loaded objects by cache
+        :raises: :exc:`ValueError` if the file is no snapshot of this server
+        """
+        min_written_at = None if max_age_s is None else time() - max_age_s
+        url, sections = read_snapshot(path, self.codec.loads, min_written_at)
+        if url != self.url:
+            raise ValueError(f"the snapshot contains resources of {url!r}")
+
+        loaded = {}
+        for section, entries in sections.items():
+            restored = self._restore_section(section, entries)
+            if restored is None:
+                LOG.warning("ignore unknown cache snapshot section %r", section)
+            else:
+                loaded[section] = restored
+        return loaded
+
+    def _restore_section(
+        self, section: str, entries: List[SnapshotEntry]
+    ) -> Optional[int]:
+        # the number of restored entries, None if the section is unknown
+        target = self._snapshot_target(section)
+        if isinstance(target, LruCache):
+            now = time()
+            max_age_s = target.max_age_s
+            restored = 0
+            for key, written_at, value, validators in entries:
+                age_s = now - written_at
+                if max_age_s is not None and age_s > max_age_s and validators is None:
+                    continue  # expired and cannot be revalidated
+                target.restore(key, value, age_s, validators)
+                restored += 1
+            return restored
+
+        if section != "tags.cache":
+            return None
+        if entries:
+            tags = self.tags
+            tags.cache.update((str(name), info) for name, _, info, _ in entries)
+            tags.loaded_at = entries[0][1]
+        return len(entries)
+
+    def cache_footprint(self) -> Dict[str, int]:
+        """
+        The estimated memory footprint of the resource caches
+        (see :attr:`cache.LruCache.nbytes`)::
+
+            footprint = client.cache_footprint()
+            print(f"{sum(footprint.values()) / 2**20:.1f} MiB cached")
+
+        :return: the size in bytes by resource endpoint of all resource managers in use,
+                 the ticket tags of :attr:`tags` as ``tags.ticket_cache``
+        """
+        return {name: cache.nbytes for name, cache in self._caches()}
+
+    def cache_stats(self) -> Dict[str, "CacheStats"]:
+        """
+        The usage counters of the resource caches (see :attr:`cache.LruCache.stats`)::
+
+            for endpoint, stats in client.cache_stats().items():
+                print(f"{endpoint}: {stats.hit_ratio:.0%} hits, {stats.size} cached")
+
+        :return: the statistics by resource endpoint of all resource managers in use,
+                 the ticket tags of :attr:`tags` as ``tags.ticket_cache``
+        """
+        return {name: cache.stats for name, cache in self._caches()}
+
+    def _caches(self) -> Iterator[Tuple[str, LruCache[Any]]]:
+        for _, manager in self._resource_managers():
+            yield manager.endpoint, manager.cache
+        tags: Optional[Tags] = vars(self).get("tags")
+        if tags is not None:
+            yield "tags.ticket_cache", tags.ticket_cache
+
+    def preload(
+        self, *managers: IterableT[Any], workers: int = 8, per_page: int = 100
+    ) -> Dict[str, int]:
+        """
+        Fill the caches of resource managers with all their objects using
+        concurrent requests. Preloading the small reference tables at startup
+        avoids a request whenever e.g. the state of a ticket is accessed first::
+
+            client.preload()  # the default reference tables
+            client.preload(client.organizations, client.groups, workers=2)
+
+        :param managers: the resource managers, by default
+                         :attr:`ticket_states`, :attr:`ticket_priorities`, :attr:`groups`,
+                         :attr:`roles` and ``time_accountings.types``
+        :param workers: maximum number of managers loaded at the same time
+        :param per_page: number of objects requested per page
+        :return: the number of loaded objects by resource endpoint
+        :raises: :exc:`APIException`, :class:`requests.HTTPError` of the first failed manager
+        """
+        if not managers:
+            managers = (
+                self.ticket_states,
+                self.ticket_priorities,
+                self.groups,
+                self.roles,
+                self.time_accountings.types,
+            )
+
+        def load(manager: IterableT[Any]) -> int:
+            return sum(1 for _ in manager.iter(per_page=per_page))
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(managers))),
+            thread_name_prefix="zammadoo",
+        ) as executor:
+            counts = list(executor.map(self.propagate_context(load), managers))
+        return {manager.endpoint: count for manager, count in zip(managers, counts)}
+
     @cached_property
     def server_version(self) -> str:
         """the Zammad server version"""
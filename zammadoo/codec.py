@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple, Type, Union
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """encodes request bodies and decodes response bodies"""
+
+    name: str  #: the name of the JSON library
+    loads: Callable[[bytes], Any]  #: decodes raw UTF-8 bytes
+    dumps: Callable[[Any], bytes]  #: encodes to raw UTF-8 bytes
+    #: the exceptions raised if the data is not valid JSON
+    decode_error: Tuple[Type[Exception], ...] = (ValueError,)
+
+
+def _stdlib_codec() -> JsonCodec:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, allow_nan=False, ensure_ascii=False).encode("utf-8")
+
+    return JsonCodec("json", json.loads, dumps, (json.JSONDecodeError,))
+
+
+def _orjson_codec() -> JsonCodec:
+    # pylint: disable=import-outside-toplevel,no-member
+    import orjson
+
+    return JsonCodec("orjson", orjson.loads, orjson.dumps, (orjson.JSONDecodeError,))
+
+
+def _msgspec_codec() -> JsonCodec:
+    # pylint: disable=import-outside-toplevel,import-error
+    import msgspec
+
+    return JsonCodec(
+        "msgspec", msgspec.json.decode, msgspec.json.encode, (msgspec.DecodeError,)
+    )
+
+
+def _ujson_codec() -> JsonCodec:
+    # pylint: disable=import-outside-toplevel,import-error,c-extension-no-member
+    import ujson
+
+    def dumps(obj: Any) -> bytes:
+        text: str = ujson.dumps(obj, ensure_ascii=False)
+        return text.encode("utf-8")
+
+    return JsonCodec("ujson", ujson.loads, dumps, (ujson.JSONDecodeError,))
+
+
+#: available codecs in order of preference
+CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "ujson": _ujson_codec,
+    "json": _stdlib_codec,
+}
+
+
+def get_codec(codec: Union[None, str, JsonCodec] = None) -> JsonCodec:
+    """
+    :param codec: the codec or the name of a JSON library in :data:`CODECS`,
+                  if ``None`` the fastest installed library is used
+    :return: the JSON codec
+    :raises: :exc:`ImportError` if the requested library is not installed
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is not None:
+        return CODECS[codec]()
+
+    for factory in CODECS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+
+    return _stdlib_codec()
+
+
+def available_codecs() -> Dict[str, JsonCodec]:
+    """:return: all codecs whose JSON library is installed"""
+    codecs: Dict[str, JsonCodec] = {}
+    for name, factory in CODECS.items():
+        try:
+            codecs[name] = factory()
+        except ImportError:
+            pass
+    return codecs
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import re
+from bisect import bisect_left
+from collections import Counter
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from requests import Response
+
+    from .client import Client
+
+#: upper bounds of the latency histogram buckets in seconds
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_ID_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+class _EndpointMetrics:
+    __slots__ = (
+        "requests",
+        "errors",
+        "latency_sum",
+        "buckets",
+        "bytes",
+        "wire_bytes",
+        "status",
+    )
+
+    def __init__(self, bucket_count: int) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.latency_sum = 0.0
+        self.buckets = [0] * (bucket_count + 1)
+        self.bytes = 0
+        self.wire_bytes = 0
+        self.status: "Counter[int]" = Counter()
+
+
+class MetricsCollector:
+    """
+    Collects request metrics by endpoint with the hooks of one or more clients.
+
+    Endpoints are identified by the HTTP method and the URL path relative
+    to the API URL where resource ids are replaced by ``{id}``, e.g.
+    ``GET tickets/{id}``.
+
+    ::
+
+        metrics = MetricsCollector()
+        metrics.attach(client)
+
+        ...
+
+        print(metrics.as_dict())
+        print(metrics.prometheus())
+
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        :param buckets: upper bounds of the latency histogram buckets in seconds
+        """
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._endpoints: Dict[Tuple[str, str], _EndpointMetrics] = {}
+        self._cache: Dict[str, "Counter[str]"] = {}
+        self._lock = Lock()
+        self._base_paths: List[str] = []
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} endpoints={len(self._endpoints)}>"
+
+    def attach(self, client: "Client") -> None:
+        """register the collector hooks for the client"""
+        base_path = urlsplit(client.url).path.rstrip("/")
+        if base_path not in self._base_paths:
+            self._base_paths.append(base_path)
+        client.add_hook("after_response", self.after_response)
+        client.add_hook("on_error", self.on_error)
+        client.add_hook("cache_lookup", self.cache_lookup)
+
+    def detach(self, client: "Client") -> None:
+        """remove the collector hooks from the client"""
+        client.remove_hook("after_response", self.after_response)
+        client.remove_hook("on_error", self.on_error)
+        client.remove_hook("cache_lookup", self.cache_lookup)
+
+    def reset(self) -> None:
+        """remove all collected data"""
+        with self._lock:
+            self._endpoints.clear()
+            self._cache.clear()
+
+    def endpoint(self, url: str) -> str:
+        """:return: the normalized endpoint of an URL"""
+        path = urlsplit(url).path
+        for base_path in self._base_paths:
+            if path.startswith(f"{base_path}/"):
+                path = path[len(base_path) :]
+                break
+        return _ID_SEGMENT.sub("{id}", path).strip("/")
+
+    def _metrics(self, method: str, url: str) -> _EndpointMetrics:
+        key = (method, self.endpoint(url))
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = self._endpoints[key] = _EndpointMetrics(len(self.buckets))
+        return metrics
+
+    def after_response(
+        self, method: str, url: str, response: "Response", elapsed_s: float
+    ) -> None:
+        """:meta private:"""
+        # the content of streamed responses is not loaded yet
+        content = vars(response).get("_content")
+        size = len(content) if isinstance(content, bytes) else 0
+        # without Content-Length the body was sent in chunks, the received size
+        # is only known for uncompressed responses
+        length = response.headers.get("Content-Length")
+        if length is not None:
+            wire_size = int(length)
+        elif "Content-Encoding" in response.headers:
+            wire_size = 0
+        else:
+            wire_size = size
+
+        with self._lock:
+            metrics = self._metrics(method, url)
+            metrics.requests += 1
+            metrics.latency_sum += elapsed_s
+            metrics.buckets[bisect_left(self.buckets, elapsed_s)] += 1
+            metrics.bytes += size
+            metrics.wire_bytes += wire_size
+            metrics.status[response.status_code] += 1
+
+    def on_error(self, method: str, url: str, _exception: Exception) -> None:
+        """:meta private:"""
+        with self._lock:
+            self._metrics(method, url).errors += 1
+
+    def cache_lookup(self, url: str, hit: bool) -> None:
+        """:meta private:"""
+        endpoint = self.endpoint(url).split("/{id}", 1)[0]
+        with self._lock:
+            counter = self._cache.setdefault(endpoint, Counter())
+            counter["hits" if hit else "misses"] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        :return: the collected metrics::
+
+            {
+                "requests": {
+                    "GET tickets/{id}": {
+                        "count": 3, "errors": 0, "latency_sum_s": 0.31,
+                        "latency_buckets": {0.01: 0, ..., "+Inf": 3},  # cumulative
+                        "bytes": 8233, "wire_bytes": 2011, "status": {200: 3},
+                    },
+                },
+                "cache": {"users": {"hits": 10, "misses": 2}},
+            }
+
+            ``bytes`` is the size of the decoded response bodies and ``wire_bytes``
+            the size as transferred (e.g. gzip compressed) according to
+            ``Content-Length``. Bodies of streamed responses are not counted
+            in ``bytes``.
+        """
+        with self._lock:
+            requests = {}
+            for (method, endpoint), metrics in sorted(self._endpoints.items()):
+                cumulative = 0
+                buckets: Dict[Any, int] = {}
+                for bound, count in zip((*self.buckets, "+Inf"), metrics.buckets):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                requests[f"{method} {endpoint}"] = {
+                    "count": metrics.requests,
+                    "errors": metrics.errors,
+                    "latency_sum_s": metrics.latency_sum,
+                    "latency_buckets": buckets,
+                    "bytes": metrics.bytes,
+                    "wire_bytes": metrics.wire_bytes,
+                    "status": dict(sorted(metrics.status.items())),
+                }
+            cache = {
+                endpoint: {"hits": counter["hits"], "misses": counter["misses"]}
+                for endpoint, counter in sorted(self._cache.items())
+            }
+        return {"requests": requests, "cache": cache}
+
+    def prometheus(self, prefix: str = "zammadoo") -> str:
+        """
+        :param prefix: the metric name prefix
+        :return: the collected metrics in the Prometheus text exposition format
+        """
+        # pylint: disable=too-many-locals
+        data = self.as_dict()
+        requests: Dict[str, Dict[str, Any]] = data["requests"]
+        cache: Dict[str, Dict[str, int]] = data["cache"]
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, description: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            return f"{prefix}_{name}"
+
+        name = metric("requests_total", "counter", "number of HTTP responses")
+        for endpoint, info in requests.items():
+            for status, count in info["status"].items():
+                lines.append(f"{name}{{{_labels(endpoint, status=status)}}} {count}")
+
+        for key, name, description in (
+            ("errors", "request_errors_total", "number of failed requests"),
+            ("bytes", "response_bytes_total", "size of the decoded response bodies"),
+            (
+                "wire_bytes",
+                "response_wire_bytes_total",
+                "size of the response bodies as transferred",
+            ),
+        ):
+            name = metric(name, "counter", description)
+            for endpoint, info in requests.items():
+                lines.append(f"{name}{{{_labels(endpoint)}}} {info[key]}")
+
+        name = metric("request_duration_seconds", "histogram", "request latency")
+        for endpoint, info in requests.items():
+            for bound, count in info["latency_buckets"].items():
+                lines.append(f"{name}_bucket{{{_labels(endpoint, le=bound)}}} {count}")
+            lines.append(f"{name}_sum{{{_labels(endpoint)}}} {info['latency_sum_s']}")
+            lines.append(f"{name}_count{{{_labels(endpoint)}}} {info['count']}")
+
+        name = metric("cache_lookups_total", "counter", "resource cache lookups")
+        for endpoint, counter in cache.items():
+            for result in ("hits", "misses"):
+                lines.append(
+                    f'{name}{{endpoint="{endpoint}",result="{result}"}} {counter[result]}'
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(endpoint: str, **extra: Any) -> str:
+    method, path = endpoint.split(" ", 1)
+    items = {"method": method, "endpoint": path, **extra}
+    return ",".join(f'{key}="{value}"' for key, value in items.items())
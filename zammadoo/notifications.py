@@ -35,7 +35,7 @@ class Notifications(IterableT[Notification]):
         items: List["JsonDict"] = self.client.get(
             self.endpoint, *args, params={"expand": True}, _erase_return_type=True
         )
-        yield from self._iter_items(items)
+        yield from self._iter_items(items, params.get("cache", True))
 
     def mark_all_as_read(self) -> None:
         self.client.post(f"{self.endpoint}/mark_all_as_read")
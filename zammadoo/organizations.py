@@ -4,7 +4,7 @@
 from typing import TYPE_CHECKING
 
 from .resource import NamedResource, UserListProperty
-from .resources import CreatableT, SearchableT
+from .resources import CreatableT, ImportableT, SearchableT
 
 if TYPE_CHECKING:
     from .client import Client
@@ -28,7 +28,9 @@ class Organization(NamedResource):
         return f"{self.parent.client.weburl}/#organization/profile/{self.id}"
 
 
-class Organizations(SearchableT[Organization], CreatableT[Organization]):
+class Organizations(
+    SearchableT[Organization], CreatableT[Organization], ImportableT[Organization]
+):
     """Organizations(...)"""
 
     _RESOURCE_TYPE = Organization
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from threading import Lock
+from time import monotonic, sleep
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket that limits the request rate of a :class:`Client`.
+
+    The bucket holds up to ``burst`` tokens and is refilled with ``rate`` tokens
+    per second. Every request takes one token, if the bucket is empty the
+    request waits until its token becomes available. The same instance can be
+    shared by multiple clients and threads.
+
+    ::
+
+        # at most 10 requests per second for all endpoints
+        client = Client(url, http_token=token, rate_limiter=RateLimiter(10))
+        # additionally at most one ticket search every 2 seconds
+        client.rate_limiters["tickets/search"] = RateLimiter(0.5)
+
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        """
+        :param rate: the number of requests per second
+        :param burst: the number of requests that can be sent at once
+                      (defaults to ``rate`` but at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate  #: requests per second
+        self.burst: int = max(1, int(rate)) if burst is None else burst  #:
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} rate={self.rate} burst={self.burst}>"
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket without waiting.
+
+        :return: the time in seconds until the reserved token is available
+        """
+        with self._lock:
+            now = monotonic()
+            tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # the token count may become negative, which queues up the waiting callers
+            self._tokens = tokens - 1.0
+            return 0.0 if tokens >= 1.0 else (1.0 - tokens) / self.rate
+
+    def acquire(self) -> float:
+        """
+        Take a token from the bucket, wait if necessary.
+
+        :return: the waiting time in seconds
+        """
+        delay = self.reserve()
+        if delay > 0.0:
+            sleep(delay)
+        return delay
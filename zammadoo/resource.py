@@ -25,7 +25,7 @@ if TYPE_CHECKING:
 
 
 class Resource(FrozenInfo):
-    __slots__ = ("id", "url", "parent")
+    __slots__ = ("id", "url", "parent", "_cached_at", "__weakref__")
 
     EXPANDED_ATTRIBUTES: Tuple[str, ...] = ()  #: :meta private:
 
@@ -42,14 +42,41 @@ class Resource(FrozenInfo):
         self.id = rid
         self.parent = parent
         self.url = f"{parent.url}/{rid}"
+        # the write time of the cache entry the properties were read from
+        self._cached_at: Optional[float] = None
         super().__init__(info or ())
 
     def __repr__(self):
         return f"<{self.__class__.__qualname__} {self.url!r}>"
 
+    def _follow(
+        self, info: Optional["JsonMapping"], cached_at: Optional[float] = None
+    ) -> None:
+        # take over the properties, ``cached_at`` is set if they were read from the cache
+        object.__setattr__(self, "_cached_at", cached_at)
+        self._replace_info(info or {})
+
+    def _follow_cache(self) -> None:
+        # update properties read from the cache if the cached ones changed, expired
+        # or were evicted, properties that did not come from the cache are kept
+        cached_at = self._cached_at
+        if cached_at is None:
+            return
+        cache = self.parent.cache
+        url = self.url
+        written_at = cache.written_at(url)
+        if written_at != cached_at:
+            self._follow(cache.peek(url), written_at)
+
+    def _follow_cached_info(self, info: "JsonDict") -> None:
+        self._follow(info, self.parent.cache.written_at(self.url))
+
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Resource) and other.url == self.url
 
+    def __hash__(self) -> int:
+        return hash(self.url)
+
     def _assert_attribute(self, name: Optional[str] = None) -> None:
         info = self._info
         if name is None:
@@ -71,8 +98,7 @@ class Resource(FrozenInfo):
         if not refresh and name_in_expanded_attributes and name not in updated_info:
             updated_info = cached_info(self.url, refresh=True, expand=True)
 
-        info.clear()
-        info.update(updated_info)
+        self._follow_cached_info(updated_info)
 
     def reload(self, expand=False) -> None:
         """
@@ -85,12 +111,10 @@ class Resource(FrozenInfo):
            if :attr:`EXPANDED_ATTRIBUTES` contains ``'*'`` **expand** will always be ``True``
 
         """
-        info = self._info
-        info.clear()
         new_info = self.parent.cached_info(
             self.url, refresh=True, expand=expand or "*" in self.EXPANDED_ATTRIBUTES
         )
-        info.update(new_info)
+        self._follow_cached_info(new_info)
 
     def last_request_age_s(self) -> Optional[float]:
         """:return: time in seconds since the last request"""
@@ -126,7 +150,7 @@ class MutableResource(Resource):
         Update the resource properties.
 
         :param kwargs: values to be updated (depending on the resource)
-        :return: a new instance of the updated resource
+        :return: the updated resource (the same object while it is referenced)
         :rtype: same as object
         """
         parent = self.parent
@@ -1,20 +1,43 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 
+import csv
+import os
+import re
 import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from io import StringIO
+from itertools import chain, islice
 from typing import (
+    IO,
     TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
     Generic,
+    Iterable,
     Iterator,
     List,
     Literal,
+    Mapping,
     Optional,
+    Sequence,
+    Tuple,
     Type,
+    TypedDict,
     TypeVar,
+    Union,
+    cast,
 )
 
-from .cache import LruCache
-from .utils import YieldCounter
+from requests import HTTPError
+
+from .cache import EvictionPolicy, LruCache
+from .utils import ImportResult, YieldCounter
 
 if TYPE_CHECKING:
     from .client import Client
@@ -25,10 +48,20 @@ if TYPE_CHECKING:
 
 
 _T_co = TypeVar("_T_co", bound="Resource", covariant=True)
+CsvRow = Union[Mapping[str, Any], Sequence[Any]]
+CsvSource = Union[str, "os.PathLike[str]", IO[str], Iterable[CsvRow]]
+_LINE_NUMBER = re.compile(r"^Line (\d+):")
+# marks the validators of expanded properties, it is not sent to the server
+_EXPANDED = "expand"
+
+
+class _TypedImport(TypedDict, total=False):
+    stats: Dict[str, int]
+    errors: List[str]
 
 
 class ResourcesT(Generic[_T_co]):
-    __slots__ = ("_client", "endpoint", "url", "cache")
+    __slots__ = ("_client", "_instances", "endpoint", "url", "cache", "missing")
 
     _RESOURCE_TYPE: Type[_T_co]
     DEFAULT_CACHE_SIZE = -1
@@ -39,15 +72,44 @@ class ResourcesT(Generic[_T_co]):
         * disable caching (0)
         * limited LRU caching (>0)
     """
+    DEFAULT_CACHE_TTL: Optional[float] = None
+    """
+    the maximum age of cached resources in seconds, older resources are
+    requested again when they are accessed (``None`` disables the expiry)
+    """
+    DEFAULT_CACHE_POLICY: Optional[Callable[[], EvictionPolicy]] = None
+    """
+    creates the eviction policy of a limited cache (e.g. :class:`cache.TwoQueuePolicy`),
+    ``None`` evicts the least recently used resources
+    """
+    DEFAULT_MISSING_TTL: Optional[float] = None
+    """
+    the time in seconds resources are remembered as missing after the server
+    responded with 404, accessing them again raises the error without a request
+    (``None`` disables the negative cache)
+    """
 
     def __init__(self, client: "Client", endpoint: str):
         self._client = weakref.ref(client)
+        # the live resources by id, the same id returns the same object
+        self._instances: "weakref.WeakValueDictionary[int, Any]" = (
+            weakref.WeakValueDictionary()
+        )
         self.endpoint: str = endpoint
         self.url = f"{client.url}/{endpoint}"  #: the resource's API URL
 
+        cache_backend = client.cache_backend
+        policy = self.DEFAULT_CACHE_POLICY
         self.cache = LruCache["JsonDict"](
-            max_size=self.DEFAULT_CACHE_SIZE
+            max_size=self.DEFAULT_CACHE_SIZE,
+            max_age_s=self.DEFAULT_CACHE_TTL,
+            backend=None if cache_backend is None else cache_backend(self.url),
+            policy=None if policy is None else policy(),
         )  #: resource LRU cache
+        #: the errors of missing resources, enabled if ``max_age_s`` is set
+        self.missing = LruCache[HTTPError](
+            max_size=1000, max_age_s=self.DEFAULT_MISSING_TTL
+        )
 
     def __call__(self, rid: int, *, info: Optional["JsonMapping"] = None) -> _T_co:
         if info is not None:
@@ -55,9 +117,30 @@ class ResourcesT(Generic[_T_co]):
             assert (
                 mapping.get("id") == rid
             ), "parameter info must contain 'id' equal to rid"
-            self.cache[f"{self.url}/{rid}"] = mapping
-
-        return self._RESOURCE_TYPE(self, rid, info=info)
+            url = f"{self.url}/{rid}"
+            self.cache[url] = mapping
+            self.missing.pop(url)
+            return self._resource(rid, mapping)
+
+        return self._resource(rid)
+
+    def _resource(
+        self, rid: int, info: Optional["JsonDict"] = None, *, cached: bool = True
+    ) -> _T_co:
+        # the live instance of the resource, properties that were read from
+        # the cache (``cached``) keep following it
+        # pylint: disable=protected-access
+        instances = self._instances
+        resource = instances.get(rid)
+        if resource is None:
+            resource = instances[rid] = self._RESOURCE_TYPE(self, rid)
+        if info is None:
+            resource._follow_cache()
+        elif cached:
+            resource._follow_cached_info(info)
+        else:
+            resource._follow(info)
+        return cast(_T_co, resource)
 
     def __repr__(self):
         return f"<{self.__class__.__qualname__} {self.url!r}>"
@@ -70,23 +153,108 @@ class ResourcesT(Generic[_T_co]):
 
     def cached_info(self, url: str, refresh=True, expand=False) -> "JsonDict":
         cache = self.cache
+        client = self.client
+        missing = self.missing
+
+        if not refresh:
+            info = cache.get(url)
+            client.call_hooks("cache_lookup", url, info is not None)
+            if info is not None:
+                return info
+            error = missing.get(url)
+            if error is not None:
+                raise _copy_error(error)
+        elif cache.age_s(url) is not None:
+            cache.count_refresh()
+
+        def _fetch() -> "JsonDict":
+            validators = cache.validators(url)
+            cached = cache.get(url, stale=True) if validators else None
+            if cached is None or validators is None:
+                validators = None
+            elif (validators.get(_EXPANDED) == "true") != bool(expand):
+                # the cached properties are the other variant, it cannot be reused
+                cached = validators = None
+            else:
+                validators = {
+                    name: value
+                    for name, value in validators.items()
+                    if name != _EXPANDED
+                }
+            try:
+                response, validators = client.get_if_modified(
+                    url, params={"expand": expand or None}, validators=validators
+                )
+            except HTTPError as exc:
+                if missing.max_age_s is not None and _is_not_found(exc):
+                    missing[url] = exc
+                raise
+            if response is None and cached is not None:
+                # not modified, the cached info is still valid
+                response = cached
+
+            if TYPE_CHECKING:
+                assert isinstance(response, dict)
+            if validators is not None and expand:
+                validators = {**validators, _EXPANDED: "true"}
+            cache.set(url, response, validators)
+            missing.pop(url)
+            return response
+
+        # concurrent lookups of the same resource share one request and cache write
+        return client.coalesce(("cached_info", url, bool(expand)), _fetch)
+
+    def get_many(
+        self, rids: Iterable[int], *, workers: int = 8, expand=False
+    ) -> List[_T_co]:
+        """
+        Load multiple resources at once. Only the resources that are not
+        cached are requested, using up to ``workers`` concurrent requests.
+
+        ::
 
-        if not refresh and url in cache:
-            return cache[url]
+            tickets = client.tickets.get_many(ticket_ids, workers=16)
 
-        response = self.client.get(url, params={"expand": expand or None})
-        if TYPE_CHECKING:
-            assert isinstance(response, dict)
-        cache[url] = response
-        return response
+        :param rids: the resource ids
+        :param workers: maximum number of concurrent requests
+        :param expand: request the missing resources with additional properties
+        :return: the resources in the order of ``rids``
+        """
+        url = self.url
+        cache = self.cache
+        rids = list(rids)
+        infos: Dict[int, "JsonDict"] = {}
+
+        for rid in rids:
+            info = None if rid in infos else cache.get(f"{url}/{rid}")
+            if info is not None:
+                infos[rid] = info
+
+        missing = [rid for rid in dict.fromkeys(rids) if rid not in infos]
+        for rid in missing:
+            error = self.missing.get(f"{url}/{rid}")
+            if error is not None:
+                raise _copy_error(error)
+
+        if missing:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(workers, len(missing))),
+                thread_name_prefix="zammadoo",
+            ) as executor:
+                fetched = executor.map(
+                    self.client.propagate_context(
+                        lambda rid: self.cached_info(f"{url}/{rid}", expand=expand)
+                    ),
+                    missing,
+                )
+                infos.update(zip(missing, fetched))
+
+        return [self._resource(rid, infos[rid]) for rid in rids]
 
     def delete(self, rid: int) -> None:
         """:meta private:"""
-        item = f"{self.url}/{rid}"
-        cache = self.cache
         self.client.delete(self.endpoint, rid)
-        if item in cache:
-            del cache[item]
+        self.cache.pop(f"{self.url}/{rid}")
 
 
 class CreatableT(ResourcesT[_T_co]):
@@ -98,13 +266,127 @@ class CreatableT(ResourcesT[_T_co]):
         return self(created_info["id"], info=created_info)
 
 
+class ImportableT(ResourcesT[_T_co]):
+    def import_csv(
+        self, source: CsvSource, *, try_run=False, chunk_size: int = 1000
+    ) -> ImportResult:
+        """
+        Create or update objects with the server's CSV import. The rows are sent in
+        chunks of ``chunk_size`` rows, so the source is never loaded completely.
+
+        ::
+
+            result = client.users.import_csv("users.csv", try_run=True)
+            if result.ok:
+                result = client.users.import_csv("users.csv")
+            print(result.stats)
+
+            client.organizations.import_csv(
+                {"name": org.name, "domain": org.domain} for org in orgs
+            )
+
+        .. note::
+            the server rejects a chunk completely if a row contains errors,
+            so check the data with ``try_run=True`` first
+
+        :param source: a path or text file of CSV data with a header row, or
+                       an iterable of rows, either mappings or sequences where
+                       the first sequence is the header
+        :param try_run: only check the data without importing it
+        :param chunk_size: maximum number of rows per request
+        :return: the aggregated statistics and row errors
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+
+        result = ImportResult(try_run=bool(try_run))
+        rows = _csv_rows(source)
+        header = next(rows, None)
+        if header is None:
+            return result
+
+        try:
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                self._import_chunk(header, chunk, result)
+        finally:
+            rows.close()
+
+        return result
+
+    def _import_chunk(
+        self, header: Sequence[Any], chunk: List[Sequence[Any]], result: ImportResult
+    ) -> None:
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(header)
+        writer.writerows(chunk)
+
+        response = self.client.request(
+            "POST",
+            self.endpoint,
+            "import",
+            params={"try": result.try_run},
+            # like the documented "curl -F 'file=@import.csv'" upload
+            files={
+                "file": ("import.csv", buffer.getvalue().encode("utf-8"), "text/csv")
+            },
+        )
+        info = cast("_TypedImport", response)
+        for key, value in (info.get("stats") or {}).items():
+            if isinstance(value, int):
+                result.stats[key] = result.stats.get(key, 0) + value
+
+        offset = result.rows
+        for error in info.get("errors") or ():
+            result.errors.append(
+                _LINE_NUMBER.sub(
+                    lambda match: f"Line {int(match[1]) + offset}:", str(error)
+                )
+            )
+        result.rows += len(chunk)
+
+
+def _csv_rows(source: CsvSource) -> Generator[Sequence[Any], None, None]:
+    # yields the header row first
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline="", encoding="utf-8") as file:
+            yield from csv.reader(file)
+        return
+
+    if hasattr(source, "read"):
+        yield from csv.reader(source)  # type: ignore[arg-type]
+        return
+
+    rows = iter(source)
+    first = next(rows, None)
+    if first is None:
+        return
+    if not isinstance(first, Mapping):
+        yield from chain((first,), rows)
+        return
+
+    header = list(first)
+    yield header
+    for row in chain((first,), rows):
+        assert isinstance(row, Mapping), "all rows must be mappings"
+        yield [row.get(key, "") for key in header]
+
+
 class IterableT(ResourcesT[_T_co]):
-    def _iter_items(self, items: List["JsonDict"]) -> Iterator[_T_co]:
+    def _iter_items(
+        self, items: Iterable["JsonDict"], cache: bool = True
+    ) -> Iterator[_T_co]:
         for item in items:
             rid = item["id"]
             assert isinstance(rid, int)
-            self.cache[f"{self.url}/{rid}"] = item
-            yield self._RESOURCE_TYPE(self, rid, info=item)
+            if cache:
+                url = f"{self.url}/{rid}"
+                self.cache[url] = item
+                self.missing.pop(url)
+            yield self._resource(rid, item, cached=cache)
 
     def iter(self, *args, **params) -> Iterator[_T_co]:
         """
@@ -126,30 +408,121 @@ class IterableT(ResourcesT[_T_co]):
             for item in resource.iter(page=5, page_size=20, expand=True):
                 print(item)
 
+        To reduce the waiting time for the server, the following pages can be
+        requested in the background while the current page is consumed::
+
+            for ticket in client.tickets.iter(per_page=100, prefetch=2):
+                print(ticket)
+
+        For large pages, ``stream=True`` decodes the objects one by one while the
+        page is received (see :meth:`Client.stream`). This lowers the memory usage
+        and the first object is available earlier. It requires an endpoint that
+        returns a JSON array and cannot be combined with ``prefetch``.
+
+        The objects are written to the resource cache. For a one-off pass over
+        many objects, ``cache=False`` leaves the cache untouched while the
+        yielded objects still contain their properties::
+
+            for ticket in client.tickets.search("state.name:closed", cache=False):
+                print(ticket.title)
+
         :param args: additional endpoint arguments
-        :param params: additional pagination options like ``page``, ``page_size``, ``extend``
+        :param params: additional pagination options like ``page``, ``page_size``, ``extend``,
+                       ``prefetch`` (the number of pages requested in advance),
+                       ``stream`` and ``cache``
         """
         pagination = self.client.pagination
         per_page = params.get("per_page", pagination.per_page)
+        prefetch: int = params.pop("prefetch", 0)
+        stream: bool = params.pop("stream", False)
+        cache: bool = params.pop("cache", True)
+        if stream and prefetch > 0:
+            raise ValueError("stream and prefetch cannot be combined")
 
         # preserving the params order is important
         params["page"] = params.get("page") or 1
         params["per_page"] = per_page
         params["expand"] = params.get("expand", pagination.expand)
 
+        if prefetch > 0:
+            pages = self._iter_pages_prefetched(args, params, prefetch)
+        else:
+            pages = self._iter_pages(args, params, stream)
+        counter = YieldCounter()
+
+        try:
+            for items in pages:
+                yield from counter(self._iter_items(items, cache))
+                yielded = counter.yielded
+
+                if per_page and yielded < per_page or yielded == 0:
+                    return
+        finally:
+            pages.close()
+
+    def _get_page(self, args: Tuple[Any, ...], params: Dict[str, Any]) -> Any:
+        return self.client.get(
+            self.endpoint, *args, params=params, _erase_return_type=True
+        )
+
+    def _iter_pages(
+        self, args: Tuple[Any, ...], params: Dict[str, Any], stream=False
+    ) -> Generator[Any, None, None]:
         while True:
-            items: List["JsonDict"] = self.client.get(
-                self.endpoint, *args, params=params, _erase_return_type=True
-            )
-            counter = YieldCounter()
+            if stream:
+                yield self.client.stream(self.endpoint, *args, params=dict(params))
+            else:
+                yield self._get_page(args, params)
+            params["page"] += 1
 
-            yield from counter(self._iter_items(items))
-            yielded = counter.yielded
+    def _iter_pages_prefetched(
+        self, args: Tuple[Any, ...], params: Dict[str, Any], prefetch: int
+    ) -> Generator[Any, None, None]:
+        # keeps at most `prefetch` pages in flight, no page is requested
+        # after a short page was received (neither in the background)
+        executor = ThreadPoolExecutor(
+            max_workers=prefetch, thread_name_prefix="zammadoo-prefetch"
+        )
+        pending: Deque["Future[Any]"] = deque()
+        per_page = params["per_page"]
+        next_page = params["page"]
+        last_page: Optional[int] = None
+        get_page = self.client.propagate_context(self._get_page)
+
+        def is_short(items: Any) -> bool:
+            # like iter(), only an empty page is known to be the last without per_page
+            return isinstance(items, list) and (
+                not items or bool(per_page) and len(items) < per_page
+            )
 
-            if per_page and yielded < per_page or yielded == 0:
+        def on_done(page: int, future: "Future[Any]") -> None:
+            nonlocal last_page
+            if future.cancelled() or future.exception() is not None:
                 return
+            if is_short(future.result()):
+                last_page = page if last_page is None else min(last_page, page)
 
-            params["page"] += 1
+        def submit() -> None:
+            nonlocal next_page
+            if last_page is not None and next_page > last_page:
+                return
+            future = executor.submit(get_page, args, {**params, "page": next_page})
+            future.add_done_callback(partial(on_done, next_page))
+            pending.append(future)
+            next_page += 1
+
+        try:
+            for _ in range(prefetch):
+                submit()
+            while pending:
+                items = pending.popleft().result()
+                if is_short(items):
+                    yield items
+                    return
+                submit()
+                yield items
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def __iter__(self) -> Iterator[_T_co]:
         return self.iter()
@@ -188,3 +561,13 @@ class SearchableT(IterableT[_T_co]):
         yield from self.iter(
             "search", query=query, sort_by=sort_by, order_by=order_by, **params
         )
+
+
+def _is_not_found(error: HTTPError) -> bool:
+    response = error.response
+    return response is not None and response.status_code == 404
+
+
+def _copy_error(error: HTTPError) -> HTTPError:
+    # a new exception for every raise, a shared one would collect the tracebacks
+    return type(error)(str(error), request=error.request, response=error.response)
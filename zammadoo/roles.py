@@ -45,6 +45,7 @@ class Roles(IterableT[Role], CreatableT[Role]):
     """Roles(...)"""
 
     _RESOURCE_TYPE = Role
+    DEFAULT_CACHE_TTL = 3600.0
 
     def __init__(self, client: "Client"):
         super().__init__(client, "roles")
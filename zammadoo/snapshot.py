@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+import json
+import mmap
+import os
+import struct
+from time import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .cache import Validators
+
+_MAGIC = b"ZMDC"
+_VERSION = 1
+# magic, version, creation time, number of sections, length of the URL
+_HEADER = struct.Struct("<4sHdII")
+# length of the name, offset and size of the data, number of entries
+_SECTION = struct.Struct("<HQQI")
+# write time, length of the key, validators and value
+_ENTRY = struct.Struct("<dIII")
+
+#: a snapshot entry: key, write time (seconds since the epoch), value and validators
+SnapshotEntry = Tuple[Hashable, float, Any, Optional["Validators"]]
+PathType = Union[str, "os.PathLike[str]"]
+
+
+def write_snapshot(
+    path: PathType,
+    url: str,
+    sections: Iterable[Tuple[str, Iterable[SnapshotEntry]]],
+    dumps: Callable[[Any], bytes],
+) -> None:
+    """
+    Write cache entries to a binary snapshot file. The file starts with a
+    header and a directory of the sections, followed by the section data.
+    The file is replaced atomically, so it can be read while a new snapshot
+    is written.
+
+    :param path: the snapshot file
+    :param url: the API URL of the cached resources
+    :param sections: the entries by section name
+    :param dumps: encodes the values to UTF-8 bytes
+    """
+    names: List[bytes] = []
+    blobs: List[Tuple[bytes, int]] = []
+    for section, entries in sections:
+        names.append(section.encode())
+        blobs.append(_encode_entries(entries, dumps))
+
+    url_data = url.encode()
+    offset = _HEADER.size + len(url_data)
+    offset += sum(_SECTION.size + len(name) for name in names)
+
+    tmp_path = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as fd:
+        fd.write(_HEADER.pack(_MAGIC, _VERSION, time(), len(names), len(url_data)))
+        fd.write(url_data)
+        for name, (blob, count) in zip(names, blobs):
+            fd.write(_SECTION.pack(len(name), offset, len(blob), count))
+            fd.write(name)
+            offset += len(blob)
+        for blob, _ in blobs:
+            fd.write(blob)
+    os.replace(tmp_path, path)
+
+
+def _encode_entries(
+    entries: Iterable[SnapshotEntry], dumps: Callable[[Any], bytes]
+) -> Tuple[bytes, int]:
+    blob = bytearray()
+    count = 0
+    for key, written_at, value, validators in entries:
+        key_data = json.dumps(key).encode()
+        validators_data = b"" if validators is None else json.dumps(validators).encode()
+        value_data = dumps(value)
+        blob += _ENTRY.pack(
+            written_at, len(key_data), len(validators_data), len(value_data)
+        )
+        blob += key_data + validators_data + value_data
+        count += 1
+    return bytes(blob), count
+
+
+def read_snapshot(
+    path: PathType,
+    loads: Callable[[bytes], Any],
+    min_written_at: Optional[float] = None,
+) -> Tuple[str, Dict[str, List[SnapshotEntry]]]:
+    """
+    Read a snapshot written by :func:`write_snapshot`. The file is memory
+    mapped and only the values of the returned entries are decoded.
+
+    :param path: the snapshot file
+    :param loads: decodes the values from UTF-8 bytes
+    :param min_written_at: skip entries written before this time
+                           (seconds since the epoch)
+    :return: the API URL and the entries by section name, ordered by write time
+    :raises: :exc:`ValueError` if the file is no snapshot
+    """
+    # pylint: disable=too-many-locals
+    with open(path, "rb") as fd:
+        if os.fstat(fd.fileno()).st_size < _HEADER.size:
+            raise ValueError(f"{os.fspath(path)!r} is no cache snapshot")
+        with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, version, _, section_count, url_size = _HEADER.unpack_from(data)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"{os.fspath(path)!r} is no cache snapshot")
+
+            position = _HEADER.size + url_size
+            url = data[_HEADER.size : position].decode()
+            sections = {}
+            for name, start, end in _iter_sections(data, position, section_count):
+                entries = list(_iter_entries(data, start, end, loads, min_written_at))
+                entries.sort(key=lambda entry: entry[1])
+                sections[name] = entries
+
+    return url, sections
+
+
+def _iter_sections(
+    data: mmap.mmap, position: int, count: int
+) -> Iterator[Tuple[str, int, int]]:
+    for _ in range(count):
+        name_size, offset, size, _ = _SECTION.unpack_from(data, position)
+        position += _SECTION.size + name_size
+        yield data[position - name_size : position].decode(), offset, offset + size
+
+
+def _iter_entries(
+    data: mmap.mmap,
+    position: int,
+    end: int,
+    loads: Callable[[bytes], Any],
+    min_written_at: Optional[float],
+) -> Iterator[SnapshotEntry]:
+    while position < end:
+        written_at, key_size, validators_size, value_size = _ENTRY.unpack_from(
+            data, position
+        )
+        position += _ENTRY.size
+        start = position
+        position += key_size + validators_size + value_size
+        if min_written_at is not None and written_at < min_written_at:
+            continue  # the value is never decoded
+
+        key = json.loads(data[start : start + key_size])
+        start += key_size
+        validators = (
+            json.loads(data[start : start + validators_size])
+            if validators_size
+            else None
+        )
+        start += validators_size
+        yield key, written_at, loads(data[start : start + value_size]), validators
@@ -1,8 +1,22 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 
+from concurrent.futures import ThreadPoolExecutor
+from time import time
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, TypedDict
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TypedDict,
+)
+
+from .cache import LruCache
+from .utils import BulkResult
 
 if TYPE_CHECKING:
     from .client import Client
@@ -20,33 +34,51 @@ class _TypedJson(TypedTag):
     tags: List[str]
 
 
+class TagChanges(TypedDict, total=False):
+    add: Iterable[str]  #: tags to be added
+    remove: Iterable[str]  #: tags to be removed
+
+
 class Tags:
     """Tags(...)
     This class manages the ``/tags``, ``/tag_list`` and ``/tag_search`` endpoint.
     """
 
+    #: the maximum number of tickets in :attr:`ticket_cache`
+    DEFAULT_TICKET_CACHE_SIZE = 1000
+    #: the maximum age of the ticket tags in :attr:`ticket_cache` in seconds,
+    #: older tags are neither returned nor used to skip changes in :meth:`apply`
+    DEFAULT_TICKET_CACHE_TTL = 60.0
+
     def __init__(self, client: "Client"):
         self.client = client
         self.cache: Dict[str, TypedTag] = {}
+        #: the tags of tickets by ticket id as returned by :meth:`by_ticket`
+        self.ticket_cache = LruCache[List[str]](
+            max_size=self.DEFAULT_TICKET_CACHE_SIZE,
+            max_age_s=self.DEFAULT_TICKET_CACHE_TTL,
+        )
         self.endpoint = "tag_list"
-        self._unintialized = True
+        #: the time of the last :meth:`reload` in seconds since the epoch,
+        #: ``None`` if the tags were not loaded yet
+        self.loaded_at: Optional[float] = None
 
     def __repr__(self):
         url = f"{self.client.url}/{self.endpoint}"
         return f"<{self.__class__.__qualname__} {url!r}>"
 
     def __iter__(self) -> Iterator["StringKeyMapping"]:
-        if self._unintialized:
+        if self.loaded_at is None:
             self.reload()
         return (MappingProxyType(value) for value in self.cache.values())
 
     def __getitem__(self, item: str) -> "StringKeyMapping":
-        if self._unintialized:
+        if self.loaded_at is None:
             self.reload()
         return MappingProxyType(self.cache[item])
 
     def __contains__(self, item: str) -> bool:
-        if self._unintialized:
+        if self.loaded_at is None:
             self.reload()
         return item in self.cache
 
@@ -57,7 +89,7 @@ class Tags:
 
         cache.clear()
         cache.update((info["name"], info) for info in items)
-        self._unintialized = False
+        self.loaded_at = time()
 
     def search(self, term: str) -> List[str]:
         """
@@ -78,7 +110,7 @@ class Tags:
         cache = self.cache
         self.client.post(self.endpoint, json={"name": name})
         if name not in cache:
-            self._unintialized = True
+            self.loaded_at = None
 
     def delete(self, name: str) -> None:
         """
@@ -121,6 +153,9 @@ class Tags:
         for name in names:
             params = {"item": name, "object": "Ticket", "o_id": tid}
             self.client.post("tags/add", json=params)
+            tags = self.ticket_cache.get(tid)
+            if tags is not None and name not in tags:
+                self._update_ticket_cache(tid, [*tags, name])
 
     def remove_from_ticket(self, tid: int, *names: str) -> None:
         """
@@ -133,6 +168,16 @@ class Tags:
         for name in names:
             params = {"item": name, "object": "Ticket", "o_id": tid}
             self.client.delete("tags/remove", json=params)
+            tags = self.ticket_cache.get(tid)
+            if tags is not None and name in tags:
+                self._update_ticket_cache(tid, [tag for tag in tags if tag != name])
+
+    def _update_ticket_cache(self, tid: int, tags: List[str]) -> None:
+        # keep the age, the other tags of the ticket are not more recent
+        ticket_cache = self.ticket_cache
+        age_s = ticket_cache.age_s(tid)
+        if age_s is not None:
+            ticket_cache.restore(tid, tags, age_s)
 
     def by_ticket(self, tid: int) -> List[str]:
         """
@@ -144,4 +189,69 @@ class Tags:
         items: "_TypedJson" = self.client.get(
             "tags", params={"object": "Ticket", "o_id": tid}, _erase_return_type=True
         )
-        return items["tags"]
+        tags = items["tags"]
+        self.ticket_cache[tid] = list(tags)
+        return tags
+
+    def apply(
+        self, changes: Mapping[int, TagChanges], *, workers: int = 8
+    ) -> BulkResult:
+        """
+        Add and remove tags of many tickets using up to ``workers`` concurrent
+        requests. Tags are removed before they are added. If the tags of a ticket
+        were loaded by :meth:`by_ticket` before, tags that are already added or
+        removed are skipped.
+
+        ::
+
+            result = client.tags.apply(
+                {
+                    1: {"add": ["escalated"], "remove": ["waiting"]},
+                    2: {"add": ["escalated"]},
+                },
+                workers=16,
+            )
+            for tid, error in result.failed.items():
+                print(f"ticket {tid}: {error}")
+
+        :param changes: the tag changes by ticket id
+        :param workers: maximum number of concurrent requests
+        :return: the per ticket results, the operation does not stop on errors
+        """
+        result = BulkResult()
+        if not changes:
+            return result
+
+        apply_changes = self.client.propagate_context(self._apply_changes)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(changes))),
+            thread_name_prefix="zammadoo",
+        ) as executor:
+            futures = {
+                tid: executor.submit(apply_changes, tid, change)
+                for tid, change in changes.items()
+            }
+            for tid, future in futures.items():
+                error = future.exception()
+                if error is not None:
+                    assert isinstance(error, Exception)
+                    result.failed[tid] = error
+                elif future.result():
+                    result.succeeded.append(tid)
+                else:
+                    result.unchanged.append(tid)
+
+        return result
+
+    def _apply_changes(self, tid: int, change: TagChanges) -> bool:
+        add = list(dict.fromkeys(change.get("add", ())))
+        remove = list(dict.fromkeys(change.get("remove", ())))
+        # only fresh tags can tell that a change is not needed
+        tags = self.ticket_cache.get(tid)
+        if tags is not None:
+            remove = [name for name in remove if name in tags]
+            add = [name for name in add if name not in tags or name in remove]
+
+        self.remove_from_ticket(tid, *remove)
+        self.add_to_ticket(tid, *add)
+        return bool(add or remove)
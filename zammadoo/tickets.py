@@ -1,21 +1,27 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Literal,
+    Mapping,
     Optional,
+    Tuple,
     TypedDict,
     Union,
     get_args,
 )
 
+from .cache import TwoQueuePolicy
 from .resource import MutableResource, NamedResource, UserProperty
 from .resources import CreatableT, IterableT, SearchableT
 from .time_accountings import TimeAccounting, TimeAccountingType
-from .utils import OptionalDateTime
+from .utils import BulkResult, OptionalDateTime
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -53,6 +59,7 @@ class Priorities(IterableT[Priority], CreatableT[Priority]):
     """Priorities(...)"""
 
     _RESOURCE_TYPE = Priority
+    DEFAULT_CACHE_TTL = 3600.0
 
     def create(self, name: str, **kwargs) -> Priority:
         """
@@ -91,6 +98,7 @@ class States(IterableT[State], CreatableT[State]):
     """States(...)"""
 
     _RESOURCE_TYPE = State
+    DEFAULT_CACHE_TTL = 3600.0
 
     def __init__(self, client: "Client"):
         super().__init__(client, "ticket_states")
@@ -383,12 +391,13 @@ class Ticket(MutableResource):
         Update the ticket properties.
 
         :param kwargs: additional values to be updated
-        :return: a new instance of the updated ticket
+        :return: the updated ticket (the same object while it is referenced)
         :rtype: :class:`Ticket`
         """
         body = kwargs.pop("body", None)
         if body:
-            article = kwargs.setdefault("article", {})
+            # copy, the same article may be passed to concurrent updates
+            article = kwargs["article"] = dict(kwargs.get("article") or {})
             article.setdefault("body", body)
             article.setdefault("internal", kwargs.pop("internal", True))
 
@@ -406,6 +415,18 @@ class Ticket(MutableResource):
         )
         return info["history"]
 
+    def iter_history(self) -> Iterator["StringKeyMapping"]:
+        """
+        .. note::
+            this method uses an undocumented API endpoint
+
+        Like :meth:`history`, but the entries are decoded one by one while the
+        response is received, which keeps the memory usage low for long histories.
+
+        :return: an iterator over the ticket's history
+        """
+        return self.parent.client.stream("ticket_history", self.id, key="history")
+
     @property
     def weburl(self) -> str:
         """URL of the ticket in the webclient"""
@@ -417,22 +438,30 @@ class Tickets(SearchableT[Ticket], CreatableT[Ticket]):
 
     _RESOURCE_TYPE = Ticket
     DEFAULT_CACHE_SIZE = 100
+    DEFAULT_CACHE_TTL = 60.0
+    # searches must not flush the tickets that are used again and again
+    DEFAULT_CACHE_POLICY = TwoQueuePolicy
 
     def __init__(self, client: "Client"):
         super().__init__(client, "tickets")
 
-    def _iter_items(self, items: Union["StringKeyMapping", List["JsonDict"]]):
-        if isinstance(items, list):
-            yield from super()._iter_items(items)
+    def _iter_items(
+        self, items: Union["StringKeyMapping", Iterable["JsonDict"]], cache=True
+    ):
+        if not isinstance(items, Mapping):
+            yield from super()._iter_items(items, cache)
             return
 
-        cache_assets(self.client, items.get("assets", {}))
+        assets = items.get("assets", {})
+        if cache:
+            cache_assets(self.client, assets)
+        infos = assets.get("Ticket", {})
 
         for key in ("record_ids", "tickets"):
             rids = items.get(key)
             if rids is not None:
                 for rid in rids:
-                    yield self._RESOURCE_TYPE(self, rid)
+                    yield self._resource(rid, infos.get(str(rid)), cached=cache)
                 break
 
     def create(
@@ -472,6 +501,60 @@ class Tickets(SearchableT[Ticket], CreatableT[Ticket]):
 
         return super()._create(info)
 
+    def update_many(
+        self,
+        items: Union[
+            Mapping[int, "StringKeyMapping"],
+            Iterable[Tuple[Union[int, Ticket], "StringKeyMapping"]],
+        ],
+        *,
+        workers: int = 8,
+    ) -> BulkResult:
+        """
+        Update many tickets using up to ``workers`` concurrent requests. The
+        updated tickets are written to the cache.
+
+        ::
+
+            result = client.tickets.update_many(
+                {tid: {"state": "closed", "body": "closed by cleanup"} for tid in tids},
+                workers=16,
+            )
+            retry = {tid: {"state": "closed"} for tid in result.failed}
+
+        :param items: the properties to be updated by ticket or ticket id,
+                      supports the ``body`` and ``internal`` article shortcut
+                      of :meth:`Ticket.update`
+        :param workers: maximum number of concurrent requests
+        :return: the per ticket results, the operation does not stop on errors
+        """
+        pairs = list(items.items() if isinstance(items, Mapping) else items)
+        result = BulkResult()
+        if not pairs:
+            return result
+
+        def update(ticket: Union[int, Ticket], kwargs: "StringKeyMapping") -> Ticket:
+            if isinstance(ticket, int):
+                ticket = self(ticket)
+            return ticket.update(**kwargs)
+
+        run = self.client.propagate_context(update)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(pairs))),
+            thread_name_prefix="zammadoo",
+        ) as executor:
+            futures = [executor.submit(run, *pair) for pair in pairs]
+            for (ticket, _), future in zip(pairs, futures):
+                tid = ticket if isinstance(ticket, int) else ticket.id
+                error = future.exception()
+                if error is None:
+                    result.succeeded.append(tid)
+                else:
+                    assert isinstance(error, Exception)
+                    result.failed[tid] = error
+
+        return result
+
 
 def cache_assets(client: "Client", assets: Dict[str, Dict[str, "JsonDict"]]) -> None:
     for key, asset in assets.items():
@@ -479,3 +562,4 @@ def cache_assets(client: "Client", assets: Dict[str, Dict[str, "JsonDict"]]) ->
         for rid_s, info in asset.items():
             url = f"{resources.url}/{rid_s}"
             resources.cache[url] = info
+            resources.missing.pop(url)
@@ -30,11 +30,13 @@ class TimeAccountingTypes(
 
     def cached_info(self, url: str, refresh=True, expand=False) -> "JsonDict":
         cache = self.cache
-        if url not in cache or refresh:
+        info = None if refresh else cache.get(url)
+        if info is None:
             for _ in self:
                 pass
+            info = cache[url]
 
-        return cache[url]
+        return info
 
     def create(
         self, name: str, *, note: Optional[str] = None, active: bool = True
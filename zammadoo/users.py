@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Union, cast
 
 from .groups import Group
 from .resource import NamedResource, OptionalUserProperty
-from .resources import CreatableT, SearchableT
+from .resources import CreatableT, ImportableT, SearchableT
 from .utils import AttributeT, OptionalDateTime
 
 if TYPE_CHECKING:
@@ -99,7 +99,7 @@ class User(NamedResource):
         return groups.get(str(group), [])
 
 
-class Users(SearchableT[User], CreatableT[User]):
+class Users(SearchableT[User], CreatableT[User], ImportableT[User]):
     """Users(...)"""
 
     _RESOURCE_TYPE = User
@@ -142,4 +142,4 @@ class Users(SearchableT[User], CreatableT[User]):
         info: "TypedResourceDict" = self.client.get(
             self.endpoint, "me", _erase_return_type=True
         )
-        return self._RESOURCE_TYPE(self, info["id"], info=info)
+        return self._resource(info["id"], info, cached=False)
@@ -1,15 +1,23 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 
+import json
+import re
 import sys
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import chain
+from threading import Lock
 from types import MappingProxyType
 from typing import (
     Any,
+    Callable,
     Dict,
     Generic,
+    Hashable,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -41,6 +49,101 @@ class YieldCounter:
             yield item
 
 
+class SingleFlight:
+    """
+    Deduplicates concurrent calls: while a call for a key is in flight, other
+    threads calling with the same key wait for it and share its result or exception.
+    """
+
+    _T = TypeVar("_T")
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: Dict[Hashable, "Future[Any]"] = {}
+        self._followers: Dict[Hashable, int] = {}
+
+    def __call__(
+        self,
+        key: Hashable,
+        func: Callable[[], _T],
+        copy: Optional[Callable[[_T], _T]] = None,
+    ) -> _T:
+        """
+        :param key: calls with equal keys are deduplicated
+        :param func: the call
+        :param copy: if given, the waiting threads get a copy of the result
+                     instead of the object returned to the calling thread
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+                self._followers[key] = 0
+            else:
+                self._followers[key] += 1
+
+        if not leader:
+            result: SingleFlight._T = future.result()
+            return result if copy is None else copy(result)
+
+        try:
+            result = func()
+        except BaseException as exc:
+            self._finish(key)
+            future.set_exception(exc)
+            raise
+
+        if self._finish(key) and copy is not None:
+            # the followers copy from a private snapshot, the caller may change result
+            future.set_result(copy(result))
+        else:
+            future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> int:
+        # no new followers after this, :return: the number of waiting threads
+        with self._lock:
+            del self._calls[key]
+            return self._followers.pop(key)
+
+
+@dataclass
+class BulkResult:
+    """the outcome of a bulk operation by resource id"""
+
+    #: ids of the changed resources
+    succeeded: List[int] = field(default_factory=list)
+    #: ids of the resources that needed no change
+    unchanged: List[int] = field(default_factory=list)
+    #: the errors by resource id
+    failed: Dict[int, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """``True`` if no operation failed"""
+        return not self.failed
+
+
+@dataclass
+class ImportResult:
+    """the aggregated outcome of a CSV import"""
+
+    #: ``True`` if the import was only tried and no data was changed
+    try_run: bool
+    #: number of data rows sent to the server
+    rows: int = 0
+    #: the summed up server statistics (e.g. ``{"created": 3, "updated": 1}``)
+    stats: Dict[str, int] = field(default_factory=dict)
+    #: the server's row errors, line numbers refer to the data rows of the whole source
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """``True`` if no row failed"""
+        return not self.errors
+
+
 class FrozenInfo:
     __slots__ = ("_info", "_frozen")
 
@@ -59,6 +162,7 @@ class FrozenInfo:
         except KeyError:
             self._assert_attribute(name)
 
+        info = self._info
         if name in info:
             return info[name]
 
@@ -69,6 +173,11 @@ class FrozenInfo:
     def _assert_attribute(self, name: Optional[str] = None) -> None:
         pass
 
+    def _replace_info(self, info: JsonMapping) -> None:
+        # swap in a copy instead of changing the dict, so readers in
+        # other threads see either the old or the new properties
+        object.__setattr__(self, "_info", dict(info))
+
     def __setattr__(self, name: str, value: Any) -> None:
         try:
             self.__getattribute__("_frozen")
@@ -86,7 +195,7 @@ class FrozenInfo:
             return info[name]
         except KeyError:
             self._assert_attribute(name)
-        return info[name]
+        return self._info[name]
 
     def __dir__(self):
         names = super().__dir__()
@@ -142,3 +251,135 @@ class OptionalDateTime(_AttributeBase):
     def __get__(self, instance, owner=None) -> Optional[datetime]:
         value = instance[self.name]
         return None if value is None else convert_date(instance[self.name])
+
+
+_JSON_TOKEN = re.compile(rb'["\[\]{},]')
+_JSON_STRING_END = re.compile(rb'["\\]')
+
+
+class _JsonArrayScanner:
+    # splits a JSON document into the raw items of one array while it is received
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, key: Optional[str]) -> None:
+        self.name = "JSON array" if key is None else f"JSON array {key!r}"
+        self.key = None if key is None else json.dumps(key)[1:-1].encode("utf-8")
+        self.buffer = bytearray()
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.string_start: Optional[int] = None
+        self.last_key: Optional[bytes] = None
+        self.target_depth: Optional[int] = None
+        self.item_start: Optional[int] = None
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        buffer = self.buffer
+        buffer += chunk
+        items: List[bytes] = []
+        while not self.done:
+            if self.in_string:
+                match = _JSON_STRING_END.search(buffer, self.pos)
+                if match is None:
+                    self.pos = len(buffer)
+                    break
+                if match[0] == b"\\":
+                    if match.end() >= len(buffer):
+                        self.pos = match.start()
+                        break
+                    self.pos = match.end() + 1
+                    continue
+                self.pos = match.end()
+                self.in_string = False
+                if self.string_start is not None:
+                    self.last_key = bytes(buffer[self.string_start + 1 : match.start()])
+                    self.string_start = None
+                continue
+
+            match = _JSON_TOKEN.search(buffer, self.pos)
+            if match is None:
+                self.pos = len(buffer)
+                break
+            self.pos = match.end()
+            self._token(match[0], match.start(), items)
+
+        self._trim()
+        return items
+
+    def _token(self, token: bytes, start: int, items: List[bytes]) -> None:
+        if self.depth == 0 and token != (b"[" if self.key is None else b"{"):
+            expected = "array" if self.key is None else "object"
+            raise ValueError(f"expected a JSON {expected}")
+
+        if token == b'"':
+            self.in_string = True
+            if self.depth == 1 and self.key is not None:
+                self.string_start = start
+        elif token in b"[{":
+            self.depth += 1
+            if self.target_depth is None and (
+                self.depth == 1
+                if self.key is None
+                else self.depth == 2 and token == b"[" and self.last_key == self.key
+            ):
+                self.target_depth = self.depth
+                self.item_start = self.pos
+        elif token in b"]}":
+            if self.depth == self.target_depth:
+                self._add_item(start, items)
+                self.done = True
+            self.depth -= 1
+        elif self.depth == self.target_depth:  # comma
+            self._add_item(start, items)
+            self.item_start = self.pos
+
+    def _add_item(self, end: int, items: List[bytes]) -> None:
+        assert self.item_start is not None
+        item = bytes(self.buffer[self.item_start : end]).strip()
+        if item:
+            items.append(item)
+
+    def _trim(self) -> None:
+        keep = min(
+            (
+                start
+                for start in (self.item_start, self.string_start, self.pos)
+                if start is not None
+            ),
+        )
+        if keep:
+            del self.buffer[:keep]
+            self.pos -= keep
+            if self.item_start is not None:
+                self.item_start -= keep
+            if self.string_start is not None:
+                self.string_start -= keep
+
+    def close(self) -> None:
+        if not self.done:
+            raise ValueError(f"incomplete or missing {self.name}")
+
+
+def iter_json_array(
+    chunks: Iterable[bytes],
+    loads: Callable[[bytes], Any] = json.loads,
+    key: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Decode the items of a JSON array one by one while the document is received.
+    Only one item has to be kept in memory at once.
+
+    :param chunks: the JSON document in chunks of bytes
+    :param loads: the function that decodes a single item
+    :param key: decode the array of this key of a top level JSON object
+                instead of a top level array, the rest of the document is ignored
+    :raises: :exc:`ValueError` if the document has not the expected structure
+    """
+    scanner = _JsonArrayScanner(key)
+    for chunk in chunks:
+        for item in scanner.feed(chunk):
+            yield loads(item)
+        if scanner.done:
+            return
+    scanner.close()